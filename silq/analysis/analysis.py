@@ -16,6 +16,24 @@ __all__ = ['find_high_low', 'edge_voltage', 'find_up_proportion',
 logger = logging.getLogger(__name__)
 
 
+def _stack_traces(traces: np.ndarray) -> Union[np.ndarray, None]:
+    """Stack traces into a 2D array, such that they can be analysed at once
+
+    Args:
+        traces: 2D array or list of traces. A 1D array is a single trace.
+
+    Returns:
+        2D array of traces, or None if the traces have different lengths
+    """
+    try:
+        traces_array = np.asarray(traces)
+    except ValueError:
+        return None
+    if traces_array.dtype == object:
+        return None
+    return np.atleast_2d(traces_array)
+
+
 def find_high_low(traces: np.ndarray,
                   plot: bool = False,
                   threshold_peak: float = 0.02,
@@ -235,6 +253,9 @@ def edge_voltage(traces: np.ndarray,
     assert edge in ['begin', 'end'], f'Edge {edge} must be `begin` or `end`'
     assert state in ['low', 'high'], f'State {state} must be `low` or `high`'
 
+    if not len(traces):
+        return np.zeros(0, dtype=bool)
+
     if edge == 'begin':
         if start_idx > 0:
             idx_list = slice(start_idx, start_idx + points)
@@ -249,14 +270,18 @@ def edge_voltage(traces: np.ndarray,
 
     if threshold_voltage is None:
         # print('Could not find two peaks for empty and load state')
-        success = np.array([False] * len(traces))
-    elif state == 'low':
-        success = [np.mean(trace[idx_list]) < threshold_voltage
-                   for trace in traces]
+        return np.zeros(len(traces), dtype=bool)
+
+    # Average edge of all traces at once, unless they have different lengths
+    traces_array = _stack_traces(traces)
+    if traces_array is not None:
+        edge_voltages = np.mean(traces_array[:, idx_list], axis=1)
     else:
-        success = [np.mean(trace[idx_list]) > threshold_voltage
-                   for trace in traces]
-    return np.array(success)
+        edge_voltages = np.array([np.mean(trace[idx_list]) for trace in traces])
+    if state == 'low':
+        return edge_voltages < threshold_voltage
+    else:
+        return edge_voltages > threshold_voltage
 
 
 def find_up_proportion(traces: np.ndarray,
@@ -286,6 +311,9 @@ def find_up_proportion(traces: np.ndarray,
     """
     # trace has to contain read stage only
     # TODO Change start point to start time (sampling rate independent)
+    if not len(traces):
+        return np.zeros(0, dtype=bool) if return_array else 0
+
     if threshold_voltage is None:
         threshold_voltage = find_high_low(traces)['threshold_voltage']
 
@@ -297,12 +325,18 @@ def find_up_proportion(traces: np.ndarray,
                               mode='valid')
                   for trace in traces]
 
-    # Filter out the traces that contain one or more peaks
-    traces_up_electron = np.array([np.any(trace[start_idx:] > threshold_voltage)
-                                   for trace in traces])
+    # Filter out the traces that contain one or more peaks, checking all
+    # traces at once unless they have different lengths
+    traces_array = _stack_traces(traces)
+    if traces_array is not None:
+        traces_up_electron = np.any(
+            traces_array[:, start_idx:] > threshold_voltage, axis=1)
+    else:
+        traces_up_electron = np.array(
+            [np.any(trace[start_idx:] > threshold_voltage) for trace in traces])
 
     if not return_array:
-        return sum(traces_up_electron) / len(traces)
+        return np.sum(traces_up_electron) / len(traces_up_electron)
     else:
         return traces_up_electron
 
@@ -559,7 +593,7 @@ def analyse_traces(traces: np.ndarray,
                                             start_idx=start_idx,
                                             threshold_voltage=threshold_voltage,
                                             return_array=True)
-    results['up_proportion'] = sum(up_proportion_idxs) / len(traces)
+    results['up_proportion'] = np.sum(up_proportion_idxs) / len(traces)
 
     # Calculate ratio of traces that end up with low voltage
     idx_end_low = edge_voltage(segmented_filtered_traces,
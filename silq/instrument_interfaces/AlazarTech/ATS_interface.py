@@ -1,13 +1,11 @@
 import numpy as np
 import inspect
 import logging
-from functools import partial
-from typing import List, Union, Dict
+from functools import partial, lru_cache
+from typing import List, Union, Dict, Tuple
 from time import sleep
 
 from qcodes.utils import validators as vals
-from qcodes.instrument_drivers.AlazarTech.ATS import AlazarTech_ATS, \
-    ATSAcquisitionParameter
 from qcodes.station import Station
 from qcodes.instrument.base import Instrument
 
@@ -18,6 +16,33 @@ from silq.pulses import Pulse, SteeredInitialization, TriggerPulse,\
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for settings that are not in a settings dict (they may be None)
+_MISSING = object()
+
+
+@lru_cache(maxsize=1)
+def _get_ats_signatures() -> Tuple[tuple, tuple, tuple]:
+    """Valid ATS configuration and acquisition settings.
+
+    Settings are obtained from the signatures of ``ATS.config`` and
+    ``ATS.acquire``. These are identical for all interfaces, and so are only
+    determined once, when the first `ATSInterface` is created. The ATS driver
+    is also only imported at that point.
+
+    Returns:
+        Sorted configuration setting names, sorted acquisition setting names,
+        and sorted names of all settings.
+    """
+    from qcodes.instrument_drivers.AlazarTech.ATS import AlazarTech_ATS
+
+    configuration_names = tuple(sorted(
+        inspect.signature(AlazarTech_ATS.config).parameters))
+    acquisition_names = tuple(sorted(
+        inspect.signature(AlazarTech_ATS.acquire).parameters))
+    all_names = tuple(sorted(configuration_names + acquisition_names))
+    return configuration_names, acquisition_names, all_names
+
+
 class ATSInterface(InstrumentInterface):
     """Interface for the AlazarTech ATS.
 
@@ -57,24 +82,32 @@ class ATSInterface(InstrumentInterface):
         self.pulse_sequence.allow_untargeted_pulses = True
 
         # Define channels
-        self._acquisition_channels = {
-            'ch'+idx: Channel(instrument_name=self.instrument_name(),
-                               name='ch'+idx,
-                               id=idx, input=True)
-            for idx in ['A', 'B', 'C', 'D']}
-        self._aux_channels = {'aux'+idx: Channel(
-            instrument_name=self.instrument_name(),
-            name='aux'+idx,
-            input_TTL=True,
-            output_TTL=(0,5))
-                             for idx in ['1', '2']}
+        instrument_name = self.instrument_name()
+        self._acquisition_channels = {}
+        for idx in ('A', 'B', 'C', 'D'):
+            channel_name = 'ch' + idx
+            self._acquisition_channels[channel_name] = Channel(
+                instrument_name=instrument_name, name=channel_name,
+                id=idx, input=True)
+        self._aux_channels = {}
+        for idx in ('1', '2'):
+            channel_name = 'aux' + idx
+            self._aux_channels[channel_name] = Channel(
+                instrument_name=instrument_name, name=channel_name,
+                input_TTL=True, output_TTL=(0, 5))
         self._channels = {
             **self._acquisition_channels,
             **self._aux_channels,
-            'trig_in':  Channel(instrument_name=self.instrument_name(),
+            'trig_in':  Channel(instrument_name=instrument_name,
                                 name='trig_in', input_trigger=True),
-            'software_trig_out': Channel(instrument_name=self.instrument_name(),
+            'software_trig_out': Channel(instrument_name=instrument_name,
                                          name='software_trig_out')}
+        # Channel ids are fixed, as is the resulting channel_selection setting
+        # for a given set of acquisition channels
+        self._channel_id_map = {name: channel.id
+                                for name, channel in self._channels.items()}
+        self._channel_selection_cache = {}
+        self._acquisition_channel_names = tuple(self._acquisition_channels)
 
         self.pulse_implementations = [
             SteeredInitializationImplementation(
@@ -84,17 +117,19 @@ class ATSInterface(InstrumentInterface):
 
         # Organize acquisition controllers
         self.acquisition_controllers = {}
+        self._controller_names_tuple = ()
         for acquisition_controller_name in acquisition_controller_names:
             self.add_acquisition_controller(acquisition_controller_name)
 
-        # Obtain a list of all valid ATS configuration settings
-        self._configuration_settings_names = sorted(list(
-            inspect.signature(AlazarTech_ATS.config).parameters.keys()))
-        # Obtain a list of all valid ATS acquisition settings
-        self._acquisition_settings_names = sorted(list(
-            inspect.signature(AlazarTech_ATS.acquire).parameters.keys()))
-        self._settings_names = sorted(self._acquisition_settings_names +
-                                      self._configuration_settings_names)
+        # All valid ATS configuration and acquisition settings
+        (self._configuration_settings_names,
+         self._acquisition_settings_names,
+         self._settings_names) = _get_ats_signatures()
+        self._configuration_settings_names_set = frozenset(
+            self._configuration_settings_names)
+        self._acquisition_settings_names_set = frozenset(
+            self._acquisition_settings_names)
+        self._settings_names_set = frozenset(self._settings_names)
 
         self.add_parameter(name='default_settings',
                            get_cmd=None, set_cmd=None,
@@ -102,20 +137,22 @@ class ATSInterface(InstrumentInterface):
                            docstring='Default settings to use when setting up '
                                      'ATS for a pulse sequence')
         initial_configuration_settings = {k: v for k, v in default_settings.items()
-                                          if k in self._configuration_settings_names}
+                                          if k in self._configuration_settings_names_set}
         self.add_parameter(name='configuration_settings',
                            get_cmd=None,
                            set_cmd=None,
                            vals=vals.Dict(allowed_keys=self._configuration_settings_names),
                            initial_value=initial_configuration_settings)
         initial_acquisition_settings = {k: v for k, v in default_settings.items()
-                                        if k in self._acquisition_settings_names}
+                                        if k in self._acquisition_settings_names_set}
         self.add_parameter(name='acquisition_settings',
                            get_cmd=None,
                            set_cmd=None,
                            vals=vals.Dict(allowed_keys=self._acquisition_settings_names),
                            initial_value=initial_acquisition_settings)
 
+        from qcodes.instrument_drivers.AlazarTech.ATS import \
+            ATSAcquisitionParameter
         self.add_parameter(name="acquisition",
                            parameter_class=ATSAcquisitionParameter)
 
@@ -123,12 +160,12 @@ class ATSInterface(InstrumentInterface):
                            set_cmd=None,
                            initial_value='None',
                            vals=vals.Enum(None,
-                               'None', *self.acquisition_controllers.keys()))
+                               'None', *self._controller_names_tuple))
 
         self.add_parameter(name='acquisition_controller',
                            set_cmd=None,
                            vals=vals.Enum(
-                               'None', *self.acquisition_controllers.keys()))
+                               'None', *self._controller_names_tuple))
 
         # Names of acquisition channels [chA, chB, etc.]
         self.add_parameter(name='acquisition_channels',
@@ -152,7 +189,7 @@ class ATSInterface(InstrumentInterface):
                            set_cmd=None,
                            initial_value='trig_in',
                            vals=vals.Enum('trig_in', 'disable',
-                                          *self._acquisition_channels.keys()))
+                                          *self._acquisition_channel_names))
         self.add_parameter(name='trigger_slope',
                            set_cmd=None,
                            vals=vals.Enum('positive', 'negative'))
@@ -180,6 +217,9 @@ class ATSInterface(InstrumentInterface):
 
         self.traces = {}
         self.pulse_traces = {}
+        # (pulse.full_name, start_idx, pts, pulse.average) of each pulse to be
+        # acquired, determined during setup
+        self._acquisition_segments = None
 
     @property
     def _acquisition_controller(self):
@@ -212,12 +252,27 @@ class ATSInterface(InstrumentInterface):
         cls_name = cls_name.replace('_AcquisitionController', '')
 
         self.acquisition_controllers[cls_name] = acquisition_controller
+        self._controller_names_tuple = tuple(self.acquisition_controllers)
 
         # Update possible values for (default) acquisition controller
         self.default_acquisition_controller.vals = vals.Enum(
-            'None', *self.acquisition_controllers.keys())
+            'None', *self._controller_names_tuple)
         self.acquisition_controller.vals = vals.Enum(
-            'None', *self.acquisition_controllers.keys())
+            'None', *self._controller_names_tuple)
+
+    def _pulse_sequence_bounds(self):
+        """Start and stop time of pulses that need to be acquired.
+
+        Returns:
+            (minimum t_start, maximum t_stop) of pulses with ``acquire=True``
+
+        Raises:
+            ValueError if there are no pulses to acquire
+        """
+        t_start, t_stop = self.pulse_sequence.get_bounds(acquire=True)
+        if t_start is None:
+            raise ValueError('Pulse sequence has no pulses to acquire')
+        return t_start, t_stop
 
     def get_additional_pulses(self, connections) -> list:
         """Additional pulses required for instrument, e.g. trigger pulses.
@@ -242,8 +297,7 @@ class ATSInterface(InstrumentInterface):
         elif self.acquisition_controller() == 'Triggered':
             # Add a single trigger pulse when starting acquisition
             if not self.capture_full_trace():
-                t_start = min(pulse.t_start for pulse in
-                              self.pulse_sequence.get_pulses(acquire=True))
+                t_start, _ = self._pulse_sequence_bounds()
             else:
                 t_start = 0
             return [TriggerPulse(t_start=t_start,
@@ -256,10 +310,7 @@ class ATSInterface(InstrumentInterface):
             # TODO add possibility of continuous acquisition having correct
             # timing even if it should acquire for the entire duration of the
             #  pulse sequence.
-            t_start = min(pulse.t_start for pulse in
-                          self.pulse_sequence.get_pulses(acquire=True))
-            t_stop = max(pulse.t_stop for pulse in
-                         self.pulse_sequence.get_pulses(acquire=True))
+            t_start, t_stop = self._pulse_sequence_bounds()
             # Add a marker high for readout stage
             # Get steered initialization pulse
             initialization = self.pulse_sequence.get_pulse(initialize=True)
@@ -284,6 +335,7 @@ class ATSInterface(InstrumentInterface):
         """
         super().initialize()
         self.acquisition_controller(self.default_acquisition_controller())
+        self._acquisition_segments = None
 
     def setup(self,
               samples: Union[int, None] = None,
@@ -303,12 +355,13 @@ class ATSInterface(InstrumentInterface):
             Instead, it is triggered from the steered initialization controller.
 
         """
+        default_settings = self.default_settings()
         self.configuration_settings({
-            k: v for k,v in self.default_settings().items()
-            if k in self._configuration_settings_names})
+            k: v for k,v in default_settings.items()
+            if k in self._configuration_settings_names_set})
         self.configuration_settings({
-            k: v for k, v in self.default_settings().items()
-            if k in self._acquisition_settings_names})
+            k: v for k, v in default_settings.items()
+            if k in self._acquisition_settings_names_set})
 
         if samples is not None:
             self.samples(samples)
@@ -316,6 +369,7 @@ class ATSInterface(InstrumentInterface):
         self.setup_trigger()
         self.setup_ATS()
         self.setup_acquisition_controller()
+        self._acquisition_segments = self._get_acquisition_segments()
 
         if self.acquisition_controller() == 'SteeredInitialization':
             # Add instruction for target instrument setup and to skip start
@@ -334,17 +388,18 @@ class ATSInterface(InstrumentInterface):
             """
         # TODO: Correctly handle case where there are no trigger pulses
         if self.acquisition_controller() == 'Triggered':
-            if self.trigger_channel() == 'trig_in':
+            trigger_channel_name = self.trigger_channel()
+            if trigger_channel_name == 'trig_in':
                 self.update_settings(external_trigger_range=5)
                 trigger_range = 5
             else:
                 trigger_channel = self._acquisition_channels[
-                    self.trigger_channel()]
+                    trigger_channel_name]
                 trigger_id = trigger_channel.id
                 trigger_range = self.setting('channel_range' + trigger_id)
 
             trigger_pulses = self.input_pulse_sequence.get_pulses(
-                input_channel=self.trigger_channel())
+                input_channel=trigger_channel_name)
             if trigger_pulses:
                 trigger_pulse = min(trigger_pulses, key=lambda p: p.t_start)
                 pre_voltage, post_voltage = \
@@ -353,18 +408,20 @@ class ATSInterface(InstrumentInterface):
                 assert post_voltage != pre_voltage, \
                     'Could not determine trigger voltage transition'
 
-                self.trigger_slope('positive' if post_voltage > pre_voltage
-                                   else 'negative')
-                self.trigger_threshold((pre_voltage + post_voltage) / 2)
+                trigger_slope = ('positive' if post_voltage > pre_voltage
+                                 else 'negative')
+                self.trigger_slope(trigger_slope)
+                trigger_threshold = (pre_voltage + post_voltage) / 2
+                self.trigger_threshold(trigger_threshold)
                 # Trigger level is between 0 (-trigger_range)
                 # and 255 (+trigger_range)
-                trigger_level = int(128 + 127 * (self.trigger_threshold() /
+                trigger_level = int(128 + 127 * (trigger_threshold /
                                                  trigger_range))
 
                 self.update_settings(trigger_operation='J',
                                      trigger_engine1='J',
-                                     trigger_source1=self.trigger_channel(),
-                                     trigger_slope1=self.trigger_slope(),
+                                     trigger_source1=trigger_channel_name,
+                                     trigger_slope1=trigger_slope,
                                      trigger_level1=trigger_level,
                                      external_trigger_coupling='DC',
                                      trigger_delay=0)
@@ -408,10 +465,7 @@ class ATSInterface(InstrumentInterface):
         # Get duration of acquisition. Use flag acquire=True because
         # otherwise initialization Pulses would be taken into account as well
         if not self.capture_full_trace():
-            t_start = min(pulse.t_start for pulse in
-                          self.pulse_sequence.get_pulses(acquire=True))
-            t_stop = max(pulse.t_stop for pulse in
-                         self.pulse_sequence.get_pulses(acquire=True))
+            t_start, t_stop = self._pulse_sequence_bounds()
         else:  # Capture from t = 0 to end of pulse sequence.
             t_start = 0
             t_stop = self.pulse_sequence.duration
@@ -421,13 +475,20 @@ class ATSInterface(InstrumentInterface):
         # the nearest multiple of 16
         acquisition_duration = t_stop - t_start - 1e-12
 
-        samples_per_trace = self.sample_rate() * acquisition_duration
-        if self.acquisition_controller() == 'Triggered':
+        controller_name = self.acquisition_controller()
+        acquisition_controller = self._acquisition_controller
+        acquisition_settings = self.acquisition_settings()
+        sample_rate = self.sample_rate()
+        samples = self.samples()
+
+        samples_per_trace = sample_rate * acquisition_duration
+        if controller_name == 'Triggered':
             # samples_per_record must be a multiple of 16
-            samples_per_record = int(16 * np.ceil(float(samples_per_trace) / 16))
+            # Ceil division via negated floor division avoids numpy scalars
+            samples_per_record = int(-(-samples_per_trace // 16) * 16)
             # TODO Allow variable records_per_buffer
             records_per_buffer = 1
-            buffers_per_acquisition = self.samples()
+            buffers_per_acquisition = samples
 
             if buffers_per_acquisition > 1:
                 allocated_buffers = 2
@@ -438,23 +499,23 @@ class ATSInterface(InstrumentInterface):
                                  records_per_buffer=records_per_buffer,
                                  buffers_per_acquisition=buffers_per_acquisition,
                                  allocated_buffers=allocated_buffers)
-        elif self.acquisition_controller() == 'Continuous':
+        elif controller_name == 'Continuous':
             # records_per_buffer and buffers_per_acquisition are fixed
-            self.acquisition_settings().pop('records_per_buffer', None)
-            self.acquisition_settings().pop('buffers_per_acquisition', None)
+            acquisition_settings.pop('records_per_buffer', None)
+            acquisition_settings.pop('buffers_per_acquisition', None)
 
             # TODO better way to decide on allocated buffers
             allocated_buffers = 20
             self.update_settings(allocated_buffers=allocated_buffers)
 
             # samples_per_trace must be a multiple of samples_per_record
-            samples_per_trace = int(16 * np.ceil(float(samples_per_trace) / 16))
-            self._acquisition_controller.samples_per_trace(samples_per_trace)
-            self._acquisition_controller.traces_per_acquisition(self.samples())
-        elif self.acquisition_controller() == 'SteeredInitialization':
+            samples_per_trace = int(-(-samples_per_trace // 16) * 16)
+            acquisition_controller.samples_per_trace(samples_per_trace)
+            acquisition_controller.traces_per_acquisition(samples)
+        elif controller_name == 'SteeredInitialization':
             # records_per_buffer and buffers_per_acquisition are fixed
-            self.acquisition_settings().pop('records_per_buffer', None)
-            self.acquisition_settings().pop('buffers_per_acquisition', None)
+            acquisition_settings.pop('records_per_buffer', None)
+            acquisition_settings.pop('buffers_per_acquisition', None)
 
             # Get steered initialization pulse
             initialization = self.pulse_sequence.get_pulse(initialize=True)
@@ -462,10 +523,9 @@ class ATSInterface(InstrumentInterface):
             # TODO better way to decide on allocated buffers
             allocated_buffers = 80
 
-            samples_per_buffer = self.sample_rate() * \
-                                 initialization.t_buffer
+            samples_per_buffer = sample_rate * initialization.t_buffer
             # samples_per_record must be a multiple of 16
-            samples_per_buffer = int(16 * np.ceil(float(samples_per_buffer) / 16))
+            samples_per_buffer = int(-(-samples_per_buffer // 16) * 16)
             self.update_settings(samples_per_record=samples_per_buffer,
                                  allocated_buffers=allocated_buffers)
 
@@ -477,18 +537,21 @@ class ATSInterface(InstrumentInterface):
                     f"Channel {channel} must be in acquisition channels"
 
             # samples_per_trace must be a multiple of samples_per_buffer
-            samples_per_trace = int(samples_per_buffer * np.ceil(
-                float(samples_per_trace) / samples_per_buffer))
-            self._acquisition_controller.samples_per_trace(samples_per_trace)
-            self._acquisition_controller.traces_per_acquisition(self.samples())
+            samples_per_trace = int(
+                -(-samples_per_trace // samples_per_buffer) * samples_per_buffer)
+            acquisition_controller.samples_per_trace(samples_per_trace)
+            acquisition_controller.traces_per_acquisition(samples)
         else:
-            raise RuntimeError(f"No setup programmed for "
-                               f"{self.acquisition_controller()}")
+            raise RuntimeError(f"No setup programmed for {controller_name}")
 
         # Set acquisition channels setting
         # Channel_selection must be a sorted string of acquisition channel ids
-        channel_ids = ''.join(sorted(
-            [self._channels[ch].id for ch in self.acquisition_channels()]))
+        acquisition_channels = tuple(self.acquisition_channels())
+        channel_ids = self._channel_selection_cache.get(acquisition_channels)
+        if channel_ids is None:
+            channel_ids = ''.join(sorted(self._channel_id_map[ch]
+                                         for ch in acquisition_channels))
+            self._channel_selection_cache[acquisition_channels] = channel_ids
         if len(channel_ids) == 3:
             # TODO add 'silent' mode
             # logging.warning("ATS cannot be configured with three acquisition "
@@ -500,10 +563,9 @@ class ATSInterface(InstrumentInterface):
                              buffer_timeout=buffer_timeout)  # ms
 
         # Update settings in acquisition controller
-        self._acquisition_controller.set_acquisition_settings(
-            **self.acquisition_settings())
-        self._acquisition_controller.average_mode('none')
-        self._acquisition_controller.setup()
+        acquisition_controller.set_acquisition_settings(**acquisition_settings)
+        acquisition_controller.average_mode('none')
+        acquisition_controller.setup()
 
     def start(self):
         """Ignored method called from `Layout.start`"""
@@ -547,51 +609,69 @@ class ATSInterface(InstrumentInterface):
             ``{pulse.full_name: {channel_id: pulse_channel_trace}}``.
 
         """
-        pulse_traces = {}
-
-        if self.capture_full_trace():
-            t_start_initial = 0
-        else:
-            t_start_initial = min(p.t_start for p in
-                                  self.pulse_sequence.get_pulses(acquire=True))
-        for pulse in self.pulse_sequence.get_pulses(acquire=True):
-            delta_t_start = pulse.t_start - t_start_initial
-            start_idx = int(round(delta_t_start * self.sample_rate()))
-            pts = int(round(pulse.duration * self.sample_rate()))
+        if self._acquisition_segments is None:
+            self._acquisition_segments = self._get_acquisition_segments()
 
-            pulse_traces[pulse.full_name] = {}
+        pulse_traces = {}
+        for name, start_idx, pts, average in self._acquisition_segments:
+            channel_traces = pulse_traces[name] = {}
             for ch, trace in traces.items():
                 pulse_trace = trace[:, start_idx:start_idx + pts]
-                if pulse.average == 'point':
-                    pulse_traces[pulse.full_name][ch] = np.mean(pulse_trace)
-                elif pulse.average == 'trace':
-                    pulse_traces[pulse.full_name][ch] = np.mean(pulse_trace, 0)
-                elif 'point_segment' in pulse.average:
-                    segments = int(pulse.average.split(':')[1])
+                if average == 'point':
+                    channel_traces[ch] = np.mean(pulse_trace)
+                elif average == 'trace':
+                    channel_traces[ch] = np.mean(pulse_trace, 0)
+                elif 'point_segment' in average:
+                    segments = int(average.split(':')[1])
 
                     segments_idx = [int(round(pts * idx / segments))
                                     for idx in np.arange(segments + 1)]
 
-                    pulse_traces[pulse.full_name][ch] = np.zeros(segments)
+                    channel_traces[ch] = np.zeros(segments)
                     for k in range(segments):
-                        pulse_traces[pulse.full_name][ch][k] = np.mean(
+                        channel_traces[ch][k] = np.mean(
                             pulse_trace[:, segments_idx[k]:segments_idx[k + 1]])
-                elif 'trace_segment' in pulse.average:
-                    segments = int(pulse.average.split(':')[1])
+                elif 'trace_segment' in average:
+                    segments = int(average.split(':')[1])
 
                     segments_idx = [int(round(pts * idx / segments))
                                     for idx in np.arange(segments + 1)]
 
-                    pulse_traces[pulse.full_name][ch] = np.zeros(segments)
+                    channel_traces[ch] = np.zeros(segments)
                     for k in range(segments):
-                        pulse_traces[pulse.full_name][ch][k] = \
+                        channel_traces[ch][k] = \
                             pulse_trace[:, segments_idx[k]:segments_idx[k + 1]]
-                elif pulse.average == 'none':
-                    pulse_traces[pulse.full_name][ch] = pulse_trace
+                elif average == 'none':
+                    channel_traces[ch] = pulse_trace
                 else:
-                    raise SyntaxError(f'Unknown average mode {pulse.average}')
+                    raise SyntaxError(f'Unknown average mode {average}')
         return pulse_traces
 
+    def _get_acquisition_segments(self) -> List[tuple]:
+        """Trace segments of pulses that need to be acquired.
+
+        The segments only depend on the pulse sequence and sample rate, and are
+        therefore determined once during setup instead of every acquisition.
+
+        Returns:
+            List of ``(pulse.full_name, start_idx, pts, pulse.average)``
+            for each pulse with ``acquire`` set to True.
+        """
+        if self.capture_full_trace():
+            t_start_initial = 0
+        else:
+            t_start_initial, _ = self._pulse_sequence_bounds()
+        sample_rate = self.sample_rate()
+
+        acquisition_segments = []
+        for pulse in self.pulse_sequence.get_pulses(acquire=True):
+            delta_t_start = pulse.t_start - t_start_initial
+            start_idx = int(round(delta_t_start * sample_rate))
+            pts = int(round(pulse.duration * sample_rate))
+            acquisition_segments.append(
+                (pulse.full_name, start_idx, pts, pulse.average))
+        return acquisition_segments
+
     def setting(self, setting):
         """Obtain a setting for the ATS.
 
@@ -609,15 +689,18 @@ class ATSInterface(InstrumentInterface):
             AssertionError
                 Setting is not an ATS configuration or acquisition setting.
         """
-        assert setting in self._settings_names, \
+        assert setting in self._settings_names_set, \
             f"Kwarg {setting} is not a valid ATS acquisition setting"
-        if setting in self.configuration_settings():
-            return self.configuration_settings()[setting]
-        elif setting in self.acquisition_settings():
-            return self.acquisition_settings()[setting]
-        else:
-            # Must get latest value, since it may not be updated in ATS
-            return self.instrument.parameters[setting]()
+        value = self.configuration_settings().get(setting, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        value = self.acquisition_settings().get(setting, _MISSING)
+        if value is not _MISSING:
+            return value
+
+        # Must get latest value, since it may not be updated in ATS
+        return self.instrument.parameters[setting]()
 
     def set_configuration_settings(self, **settings):
         """ Sets the configuration settings for the ATS through its controller.
@@ -633,8 +716,7 @@ class ATSInterface(InstrumentInterface):
             AssertionError
                 Setting is not an ATS configuration setting
         """
-        assert all([setting in self._configuration_settings_names
-                    for setting in settings]), \
+        assert self._configuration_settings_names_set.issuperset(settings), \
             "Settings are not all valid ATS configuration settings"
         self._configuration_settings = settings
 
@@ -652,8 +734,7 @@ class ATSInterface(InstrumentInterface):
             AssertionError
                 Setting is not an ATS acquisition setting
         """
-        assert all([setting in self._acquisition_settings_names
-                    for setting in settings]), \
+        assert self._acquisition_settings_names_set.issuperset(settings), \
             "Settings are not all valid ATS acquisition settings"
         self._acquisition_settings = settings
 
@@ -670,19 +751,20 @@ class ATSInterface(InstrumentInterface):
             AssertionError
                 Some settings are not configuration nor acquisition settings.
         """
-        settings_valid = all(map(
-            lambda setting: setting in self._settings_names, settings.keys()))
-        assert settings_valid, \
+        assert self._settings_names_set.issuperset(settings), \
             f'Not all settings are valid ATS settings. Settings: {settings}\n' \
             f'Valid ATS settings: {self._settings_names}'
 
-        configuration_settings = {k: v for k, v in settings.items()
-                                  if k in self._configuration_settings_names}
-        self.configuration_settings().update(**configuration_settings)
-
-        acquisition_settings = {k: v for k, v in settings.items()
-                                  if k in self._acquisition_settings_names}
-        self.acquisition_settings().update(**acquisition_settings)
+        # Settings have been validated, so any non-configuration setting must
+        # be an acquisition setting
+        configuration_settings = self.configuration_settings()
+        acquisition_settings = self.acquisition_settings()
+        configuration_settings_names = self._configuration_settings_names_set
+        for key, val in settings.items():
+            if key in configuration_settings_names:
+                configuration_settings[key] = val
+            else:
+                acquisition_settings[key] = val
 
 
 class SteeredInitializationImplementation(PulseImplementation):
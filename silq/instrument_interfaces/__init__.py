@@ -1,3 +1,6 @@
+from functools import lru_cache
+from importlib import import_module
+
 from .interface import InstrumentInterface, Channel
 import qcodes as qc
 station = qc.Station()
@@ -50,13 +53,21 @@ instrument_interfaces = {
 }
 
 
-def get_instrument_interface(instrument, *args, **kwargs):
-    from . import instrument_interfaces
+@lru_cache(maxsize=None)
+def _interface_class_for(instrument_class: str):
+    """Interface class for an instrument class name.
 
-    instrument_class = instrument.__class__.__name__
+    The interface module is only imported the first time an interface is
+    requested for an instrument class, after which the class is cached.
+    """
     import_dict = instrument_interfaces[instrument_class]
-    exec(f'from {import_dict["module"]} import {import_dict["class"]}')
-    instrument_interface_class = eval(import_dict["class"])
+    module = import_module(import_dict["module"], package=__name__)
+    return getattr(module, import_dict["class"])
+
+
+def get_instrument_interface(instrument, *args, **kwargs):
+    instrument_class = instrument.__class__.__name__
+    instrument_interface_class = _interface_class_for(instrument_class)
 
     instrument_interface = instrument_interface_class(
         instrument_name=instrument.name, *args, **kwargs
@@ -1,11 +1,14 @@
 import numpy as np
 import logging
+from collections import OrderedDict
+from functools import lru_cache
 from typing import List, Union
 from copy import copy
 
 from silq import config
 from silq.instrument_interfaces import InstrumentInterface, Channel
 from silq.pulses import (
+    Pulse,
     DCPulse,
     TriggerPulse,
     SinePulse,
@@ -25,6 +28,55 @@ from qcodes.config.config import DotDict
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=64)
+def _const_waveform(amplitude: float, points: int) -> np.ndarray:
+    """Constant waveform, shared between all DC pulses of equal amplitude/points
+
+    The returned array is read-only since it is shared. Copy it first if it
+    needs to be modified.
+
+    Args:
+        amplitude: Waveform voltage
+        points: Number of waveform points
+
+    Returns:
+        Read-only float32 array with all points equal to amplitude
+    """
+    waveform = np.full(int(points), amplitude, dtype=np.float32)
+    waveform.setflags(write=False)
+    return waveform
+
+
+class _WaveformCache(OrderedDict):
+    """Least recently used cache of implemented waveforms
+
+    The cache is shared by reference, also when a pulse implementation holding
+    it is copied.
+
+    Args:
+        max_size: Maximum number of cached waveforms
+    """
+
+    def __init__(self, max_size: int = 64):
+        super().__init__()
+        self.max_size = max_size
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        self.move_to_end(key)
+        return self[key]
+
+    def add(self, key, value):
+        self[key] = value
+        if len(self) > self.max_size:
+            # Discard least recently used waveform
+            self.popitem(last=False)
+
+
 class Keysight81180AInterface(InstrumentInterface):
     """
 
@@ -121,6 +173,12 @@ class Keysight81180AInterface(InstrumentInterface):
         self.instrument.ch2.clear_waveforms()
 
         self.waveforms = {}  # List of waveform arrays for each channel
+        # Waveform indices for each channel, grouped by a waveform fingerprint.
+        # Used to quickly find existing waveforms (see add_single_waveform)
+        self._waveform_index = {}
+        # Implemented waveforms of sine pulses, shared by the sine pulse
+        # implementations targeted to this interface (see SinePulseImplementation)
+        self._sine_waveforms = _WaveformCache()
         # Optional initial waveform for each channel. Used to set the first point
         # to equal the last voltage of the final pulse (see docstring for details)
         self.waveforms_initial = {}
@@ -217,45 +275,119 @@ class Keysight81180AInterface(InstrumentInterface):
         self.instrument.ensure_idle = False
 
     def generate_waveform_sequences(self):
-        self.waveforms = {ch: [] for ch in self.active_channels()}
-        self.sequences = {ch: [] for ch in self.active_channels()}
-        self.point = {ch: 0 for ch in self.active_channels()}
-        self.point_offsets = {ch: [] for ch in self.active_channels()}
+        active_channels = self.active_channels()
+        self.waveforms = {ch: [] for ch in active_channels}
+        self._waveform_index = {ch: {} for ch in active_channels}
+        self.sequences = {ch: [] for ch in active_channels}
+        self.point = {ch: 0 for ch in active_channels}
+        self.point_offsets = {ch: [] for ch in active_channels}
+        pulse_sequence_duration = self.pulse_sequence.duration
+
+        # Group pulses by output channel in a single pass over the pulses
+        channel_pulses = {ch: [] for ch in active_channels}
+        for pulse in self.pulse_sequence.get_pulses():
+            connection = pulse.connection
+            if connection is None:
+                continue
+            elif "channel" in connection.output:
+                pulses = channel_pulses.get(connection.output["channel"].name)
+                if pulses is not None:
+                    pulses.append(pulse)
+            else:
+                # Combined connections can have multiple output channels
+                for ch, pulses in channel_pulses.items():
+                    if connection.satisfies_conditions(output_channel=ch):
+                        pulses.append(pulse)
 
-        for ch in self.active_channels():
+        for ch in active_channels:
             instrument_channel = self.instrument.channels[ch]
-            sample_rate = instrument_channel.sample_rate()
-            # Set start time t=0
-            t_pulse = 0
-            self.waveforms_initial[ch] = None
-
-            # A waveform must have at least 320 points
-            min_waveform_duration = 320 / sample_rate
-
-            # Always begin by waiting for a trigger/event pulse
-            # Add empty waveform (0V DC), with minimum points (320)
-            self.add_single_waveform(ch, waveform_array=np.zeros(320))
-
-            pulses = self.pulse_sequence.get_pulses(output_channel=ch)
-
-            for pulse in pulses:
-                # Check if there is a gap between next pulse and current time t_pulse
-                if pulse.t_start + 1e-11 < t_pulse:
-                    raise SyntaxError(
-                        f"Trying to add pulse {pulse} which starts before current "
-                        f"time position in waveform {t_pulse}"
-                    )
-                elif 1e-11 < pulse.t_start - t_pulse < min_waveform_duration + 1e-11:
-                    # The gap between pulses is smaller than the minimum waveform
-                    # duration. Cannot create DC waveform to bridge the gap
-                    raise SyntaxError(
-                        f"Delay between pulse {pulse} start {pulse.t_start} s "
-                        f"and current time {t_pulse} s is less than minimum "
-                        f"waveform duration. cannot add 0V DC pulse to bridge gap"
-                    )
-                elif pulse.t_start - t_pulse >= min_waveform_duration + 1e-11:
-                    # Add 0V DC pulse to bridge the gap between pulses
-                    self.sequences[ch] += self._add_DC_waveform(
+            self._generate_channel_sequence(
+                ch,
+                pulses=channel_pulses[ch],
+                sample_rate=instrument_channel.sample_rate(),
+                pulse_sequence_duration=pulse_sequence_duration,
+            )
+
+            waveforms = self.waveforms[ch]
+            sequence = self.sequences[ch]
+
+            # Sequence all loaded waveforms
+            waveform_idx_mapping = instrument_channel.upload_waveforms(
+                waveforms, allow_existing=True
+            )
+            # Update waveform indices since they may correspond to pre-existing waveforms
+            self.sequences[ch] = [
+                (waveform_idx_mapping[idx], *instructions)
+                for idx, *instructions in sequence
+            ]
+            instrument_channel.set_sequence(self.sequences[ch])
+
+            # Check that the sample point offsets do not exceed limit
+            self.max_point_offsets[ch] = max(np.abs(self.point_offsets[ch]))
+            if self.max_point_offsets[ch] > self.point_offset_limit:
+                logger.warning(
+                    f"81180A maximum sample point offset exceeds limit {self.point_offset_limit}. "
+                    f"Current maximum: {self.max_point_offsets}"
+                )
+            else:
+                logger.debug(
+                    "81180A sample point maximum offset: %s", self.max_point_offsets
+                )
+
+    def _generate_channel_sequence(
+        self,
+        ch: str,
+        pulses: List[Pulse],
+        sample_rate: float,
+        pulse_sequence_duration: float,
+    ):
+        """Generate waveforms and sequence of a single channel
+
+        The waveforms and sequence are stored in ``self.waveforms[ch]`` and
+        ``self.sequences[ch]``, and are not yet uploaded to the instrument.
+
+        Args:
+            ch: Name of channel
+            pulses: Pulses of channel, sorted by t_start
+            sample_rate: Channel sample rate
+            pulse_sequence_duration: Duration of the pulse sequence
+        """
+        # Set start time t=0
+        t_pulse = 0
+        self.waveforms_initial[ch] = None
+        sequence = self.sequences[ch]
+
+        # A waveform must have at least 320 points
+        min_waveform_points = 320
+
+        # Always begin by waiting for a trigger/event pulse
+        # Add empty waveform (0V DC), with minimum points (320)
+        self.add_single_waveform(ch, waveform_array=_const_waveform(0, 320))
+
+        for pulse in pulses:
+            # Compare times as integer sample points to avoid rounding errors
+            gap_points = int(round(pulse.t_start * sample_rate)) - int(
+                round(t_pulse * sample_rate)
+            )
+
+            # Check if there is a gap between next pulse and current time t_pulse
+            if gap_points < 0:
+                raise SyntaxError(
+                    f"Trying to add pulse {pulse} which starts before current "
+                    f"time position in waveform {t_pulse}"
+                )
+            elif 0 < gap_points < min_waveform_points:
+                # The gap between pulses is smaller than the minimum waveform
+                # duration. Cannot create DC waveform to bridge the gap
+                raise SyntaxError(
+                    f"Delay between pulse {pulse} start {pulse.t_start} s "
+                    f"and current time {t_pulse} s is less than minimum "
+                    f"waveform duration. cannot add 0V DC pulse to bridge gap"
+                )
+            elif gap_points >= min_waveform_points:
+                # Add 0V DC pulse to bridge the gap between pulses
+                sequence.extend(
+                    self._add_DC_waveform(
                         channel_name=ch,
                         t_start=t_pulse,
                         t_stop=pulse.t_start,
@@ -263,87 +395,83 @@ class Keysight81180AInterface(InstrumentInterface):
                         sample_rate=sample_rate,
                         pulse_name="DC",
                     )
+                )
 
-                # Get waveform of current pulse
-                waveform = pulse.implementation.implement(sample_rate=sample_rate,)
+            # Get waveform of current pulse
+            waveform = pulse.implementation.implement(sample_rate=sample_rate,)
 
-                # Add waveform and sequence steps
-                sequence_steps = self.add_pulse_waveforms(
-                    ch,
-                    **waveform,
-                    t_stop=pulse.t_stop,
-                    sample_rate=sample_rate,
-                    pulse_name=pulse.name,
-                )
-                self.sequences[ch] += sequence_steps
+            # Add waveform and sequence steps
+            sequence_steps = self.add_pulse_waveforms(
+                ch,
+                **waveform,
+                t_stop=pulse.t_stop,
+                sample_rate=sample_rate,
+                pulse_name=pulse.name,
+            )
+            sequence.extend(sequence_steps)
 
-                # Set current time to pulse.t_stop
-                t_pulse = pulse.t_stop
+            # Set current time to pulse.t_stop
+            t_pulse = pulse.t_stop
 
-            # Add 0V pulse if last pulse does not stop at pulse_sequence.duration
-            if self.pulse_sequence.duration - t_pulse >= min_waveform_duration + 1e-11:
-                self.sequences[ch] += self._add_DC_waveform(
+        # Add 0V pulse if last pulse does not stop at pulse_sequence.duration
+        final_gap_points = int(round(pulse_sequence_duration * sample_rate)) - int(
+            round(t_pulse * sample_rate)
+        )
+        if final_gap_points >= min_waveform_points:
+            sequence.extend(
+                self._add_DC_waveform(
                     channel_name=ch,
                     t_start=t_pulse,
-                    t_stop=self.pulse_sequence.duration,
+                    t_stop=pulse_sequence_duration,
                     amplitude=0,
                     sample_rate=sample_rate,
                     pulse_name="final_DC",
                 )
+            )
 
-            last_waveform_idx = self.sequences[ch][-1][0]
-            last_waveform = self.waveforms[ch][last_waveform_idx - 1]
-            last_voltage = last_waveform[-1]
+        last_waveform_idx = self.sequences[ch][-1][0]
+        last_waveform = self.waveforms[ch][last_waveform_idx - 1]
+        last_voltage = last_waveform[-1]
 
-            if self.waveforms_initial[ch] is not None:
-                waveform_initial_idx, waveform_initial = self.waveforms_initial[ch]
+        if self.waveforms_initial[ch] is not None:
+            waveform_initial_idx, waveform_initial = self.waveforms_initial[ch]
 
-                logger.debug(
-                    f"Changing first point of first waveform to {last_voltage}"
-                )
-
-                waveform_initial[0] = last_voltage
-                self.waveforms[ch][waveform_initial_idx - 1] = waveform_initial
+            logger.debug("Changing first point of first waveform to %s", last_voltage)
 
-            # Ensure there are at least three sequence instructions
-            while len(self.sequences[ch]) < 3:
-                waveform_idx = self.add_single_waveform(ch, last_voltage * np.ones(320))
-                # Add extra blank segment which will automatically run to
-                # the next segment (~ 70 ns offset)
-                self.sequences[ch].append((waveform_idx, 1, 0, "final_filler_pulse"))
+            waveform_initial[0] = last_voltage
+            self.waveforms[ch][waveform_initial_idx - 1] = waveform_initial
+            self._waveform_index[ch].setdefault(
+                self._waveform_key(waveform_initial), []
+            ).append(waveform_initial_idx - 1)
 
-            # Ensure total waveform points are less than memory limit
-            total_waveform_points = sum(
-                len(waveform) for waveform in self.waveforms["ch1"]
+        # Ensure there are at least three sequence instructions
+        while len(self.sequences[ch]) < 3:
+            waveform_idx = self.add_single_waveform(
+                ch, _const_waveform(float(last_voltage), 320)
             )
-            if total_waveform_points > self.instrument.waveform_max_length:
-                raise RuntimeError(
-                    f"Total waveform points {total_waveform_points} exceeds "
-                    f"limit of 81180A ({self.instrument.waveform_max_length})"
-                )
+            # Add extra blank segment which will automatically run to
+            # the next segment (~ 70 ns offset)
+            self.sequences[ch].append((waveform_idx, 1, 0, "final_filler_pulse"))
 
-            # Sequence all loaded waveforms
-            waveform_idx_mapping = instrument_channel.upload_waveforms(
-                self.waveforms[ch], allow_existing=True
-            )
-            # Update waveform indices since they may correspond to pre-existing waveforms
-            self.sequences[ch] = [
-                (waveform_idx_mapping[idx], *instructions)
-                for idx, *instructions in self.sequences[ch]
-            ]
-            instrument_channel.set_sequence(self.sequences[ch])
+        self._check_waveform_memory(ch)
 
-            # Check that the sample point offsets do not exceed limit
-            self.max_point_offsets[ch] = max(np.abs(self.point_offsets[ch]))
-            if self.max_point_offsets[ch] > self.point_offset_limit:
-                logger.warning(
-                    f"81180A maximum sample point offset exceeds limit {self.point_offset_limit}. "
-                    f"Current maximum: {self.max_point_offsets}"
-                )
-            else:
-                logger.debug(
-                    f"81180A sample point maximum offset: {self.max_point_offsets}"
-                )
+    def _check_waveform_memory(self, channel_name: str):
+        """Ensure total waveform points of a channel are below the memory limit
+
+        Args:
+            channel_name: Name of channel whose waveforms to check
+
+        Raises:
+            RuntimeError if total waveform points exceed the memory limit
+        """
+        total_waveform_points = sum(
+            len(waveform) for waveform in self.waveforms[channel_name]
+        )
+        if total_waveform_points > self.instrument.waveform_max_length:
+            raise RuntimeError(
+                f"Total waveform points {total_waveform_points} of {channel_name} "
+                f"exceeds limit of 81180A ({self.instrument.waveform_max_length})"
+            )
 
     def _add_DC_waveform(
         self,
@@ -363,9 +491,18 @@ class Keysight81180AInterface(InstrumentInterface):
                 amplitude=amplitude,
             )
         )
-        waveform = DCPulseImplementation.implement(
-            pulse=DC_pulse, sample_rate=sample_rate
-        )
+        if amplitude == 0 and t_start > 0:
+            # 0V gaps are looped from the 320-point zero waveform that starts
+            # every sequence, avoiding a divisor search per gap.
+            # Gaps at t=0 use the generic path, as they need a waveform_initial
+            waveform = self._zero_waveform(DC_pulse.duration * sample_rate)
+        else:
+            waveform = None
+
+        if waveform is None:
+            waveform = DCPulseImplementation.implement(
+                pulse=DC_pulse, sample_rate=sample_rate
+            )
         sequence_steps = self.add_pulse_waveforms(
             channel_name,
             **waveform,
@@ -376,6 +513,37 @@ class Keysight81180AInterface(InstrumentInterface):
 
         return sequence_steps
 
+    @staticmethod
+    def _zero_waveform(points: float, max_loops: int = 1000000) -> Union[dict, None]:
+        """Waveform for a 0V gap, looping the 320-point zero waveform
+
+        Args:
+            points: Number of sample points of the gap
+            max_loops: Maximum number of loops of the zero waveform
+
+        Returns:
+            Waveform dict, same as ``DCPulseImplementation.implement``.
+            None if the gap is too short or would need too many loops.
+        """
+        # Number of points must be a multiple of 32
+        points = 32 * int(points // 32)
+        loops, tail_points = divmod(points, 320)
+
+        if tail_points:
+            # Tail waveform must have at least 320 points
+            loops -= 1
+            tail_points += 320
+
+        if not 1 <= loops <= max_loops:
+            return None
+
+        return {
+            "waveform": _const_waveform(0, 320),
+            "loops": loops,
+            "waveform_initial": None,
+            "waveform_tail": _const_waveform(0, tail_points) if tail_points else None,
+        }
+
     def add_single_waveform(
         self, channel_name: str, waveform_array: np.ndarray, allow_existing: bool = True
     ) -> int:
@@ -398,13 +566,26 @@ class Keysight81180AInterface(InstrumentInterface):
         if len(waveform_array) < 320:
             raise SyntaxError(f"Waveform length {len(waveform_array)} < 320")
 
-        self.waveforms.setdefault(channel_name, [])
+        waveforms = self.waveforms.setdefault(channel_name, [])
+        waveform_index = self._waveform_index.setdefault(channel_name, {})
+
+        # Only waveforms in the same or a neighbouring bucket can be within the
+        # comparison tolerance, which avoids comparing against every previously
+        # added waveform. Sorted to match the first waveform, as before
+        points, bucket = waveform_key = self._waveform_key(waveform_array)
+        candidate_idxs = sorted(
+            idx
+            for neighbour in (bucket - 1, bucket, bucket + 1)
+            for idx in waveform_index.get((points, neighbour), [])
+        )
 
         # Check if waveform already exists in waveform array
         if allow_existing:
             waveform_idx = arreqclose_in_list(
-                waveform_array, self.waveforms[channel_name], atol=1e-3
+                waveform_array, [waveforms[idx] for idx in candidate_idxs], atol=1e-3
             )
+            if waveform_idx is not None:
+                waveform_idx = candidate_idxs[waveform_idx]
         else:
             waveform_idx = None
 
@@ -413,13 +594,33 @@ class Keysight81180AInterface(InstrumentInterface):
             waveform_idx += 1  # Waveform index is 1-based
         else:
             # Add waveform to current list of waveforms
-            self.waveforms[channel_name].append(waveform_array)
+            waveform_index.setdefault(waveform_key, []).append(len(waveforms))
+            waveforms.append(waveform_array)
 
             # waveform index should be the position of added waveform (1-based)
-            waveform_idx = len(self.waveforms[channel_name])
+            waveform_idx = len(waveforms)
 
         return waveform_idx
 
+    @staticmethod
+    def _waveform_key(waveform_array: np.ndarray) -> tuple:
+        """Coarse bucket of a waveform, used to look up existing waveforms.
+
+        Waveforms are bucketed by their number of points and their mean voltage
+        in steps of 10 mV. Waveforms that are equal within the comparison
+        tolerance (1 mV) have means that differ by less than one step, and are
+        therefore in the same or a neighbouring bucket. Whether waveforms are
+        equal is still determined by ``arreqclose_in_list``.
+
+        Args:
+            waveform_array: Waveform array
+
+        Returns:
+            (number of points, mean voltage bucket)
+        """
+        mean_voltage = np.mean(waveform_array, dtype=float)
+        return len(waveform_array), int(np.floor(mean_voltage / 0.01))
+
     def add_pulse_waveforms(
         self,
         channel_name: str,
@@ -512,7 +713,8 @@ class DCPulseImplementation(PulseImplementation):
         # any pulse_sequence.final_delay remains at the last voltage
         if pulse.t_start == 0 and N > 640:
             N -= 320
-            waveform_initial = pulse.amplitude * np.ones(320)
+            # Copy since its first point is modified later on
+            waveform_initial = _const_waveform(pulse.amplitude, 320).copy()
             logger.debug("adding waveform_initial")
         else:
             waveform_initial = None
@@ -542,12 +744,12 @@ class DCPulseImplementation(PulseImplementation):
             )
 
         # Add waveform(s) and sequence steps
-        waveform = pulse.amplitude * np.ones(approximate_divisor["points"])
+        waveform = _const_waveform(pulse.amplitude, approximate_divisor["points"])
 
         # Add separate waveform if there are remaining points left after division
         if approximate_divisor["remaining_points"]:
-            waveform_tail = pulse.amplitude * np.ones(
-                approximate_divisor["remaining_points"]
+            waveform_tail = _const_waveform(
+                pulse.amplitude, approximate_divisor["remaining_points"]
             )
         else:
             waveform_tail = None
@@ -568,6 +770,14 @@ class SinePulseImplementation(PulseImplementation):
         "frequency_threshold": 30,
     }
 
+    # Waveform cache of the interface, set when targeting a pulse
+    _waveform_cache = None
+
+    def target_pulse(self, pulse, interface, **kwargs):
+        targeted_pulse = super().target_pulse(pulse, interface, **kwargs)
+        targeted_pulse.implementation._waveform_cache = interface._sine_waveforms
+        return targeted_pulse
+
     def implement(self, sample_rate, plot=False, **kwargs):
         # If frequency is zero, use DC pulses instead
         if self.pulse.frequency == 0:
@@ -587,6 +797,56 @@ class SinePulseImplementation(PulseImplementation):
         )
         settings.update(**kwargs)
 
+        if plot or self._waveform_cache is None:
+            return self._implement_sine(sample_rate, settings, plot=plot)
+
+        # Sine pulses with identical properties share the same waveforms.
+        # t_start is always included since, even for a relative phase, the
+        # number of points from np.arange depends on it through rounding
+        pulse = self.pulse
+        cache_key = (
+            sample_rate,
+            pulse.t_start,
+            pulse.duration,
+            pulse.frequency,
+            pulse.phase,
+            pulse.amplitude,
+            pulse.power,
+            pulse.offset,
+            pulse.phase_reference,
+            tuple(sorted(settings.items())),
+        )
+        try:
+            hash(cache_key)
+        except TypeError:
+            # Settings contain unhashable values such as lists, skip the cache
+            return self._implement_sine(sample_rate, settings)
+
+        cached = self._waveform_cache.get(cache_key)
+        if cached is not None:
+            self.results, waveform = cached
+        else:
+            waveform = self._implement_sine(sample_rate, settings)
+            # Waveforms are shared, and so should not be modified
+            for key in ("waveform", "waveform_tail"):
+                if waveform[key] is not None:
+                    waveform[key].setflags(write=False)
+
+            self._waveform_cache.add(cache_key, (self.results, waveform))
+
+        return dict(waveform)
+
+    def _implement_sine(self, sample_rate: float, settings: dict, plot=False) -> dict:
+        """Implement sine waveforms, approximating the frequency if necessary
+
+        Args:
+            sample_rate: Channel sample rate
+            settings: Sine waveform settings, see ``pulse_to_waveform_sequence``
+            plot: Plot the approximated waveform
+
+        Returns:
+            Waveform dict, see ``DCPulseImplementation.implement``
+        """
         # Do not approximate frequency if the pulse is sufficiently short
         max_points_exact = settings.pop('max_points_exact', 4000)
         points = int(self.pulse.duration * sample_rate)
@@ -614,7 +874,7 @@ class SinePulseImplementation(PulseImplementation):
                 )
 
             return {
-                "waveform": self.pulse.get_voltage(t_list),
+                "waveform": self.pulse.get_voltage(t_list).astype(np.float32),
                 "loops": 1,
                 "waveform_initial": None,
                 "waveform_tail": None,
@@ -623,13 +883,14 @@ class SinePulseImplementation(PulseImplementation):
         optimum = self.results["optimum"]
         waveform_loops = max(optimum["repetitions"], 1)
 
-        # Temporarily modify pulse frequency to ensure waveforms have full period
-        original_frequency = self.pulse.frequency
-        self.pulse.frequency = optimum["modified_frequency"]
+        # Use modified frequency to ensure waveforms have full period
+        modified_frequency = optimum["modified_frequency"]
 
         # Get waveform points for repeated segment
         t_list = self.pulse.t_start + np.arange(optimum["points"]) / sample_rate
-        waveform_array = self.pulse.get_voltage(t_list)
+        waveform_array = self.pulse.get_voltage(
+            t_list, frequency=modified_frequency
+        ).astype(np.float32)
 
         # Potentially include a waveform tail
         waveform_tail_pts = int(optimum["final_delay"] * sample_rate)
@@ -656,7 +917,9 @@ class SinePulseImplementation(PulseImplementation):
                     1 / sample_rate,
                 )
                 t_list_tail = t_list_tail[: 32 * (len(t_list_tail) // 32)]
-                waveform_tail_array = self.pulse.get_voltage(t_list_tail)
+                waveform_tail_array = self.pulse.get_voltage(
+                    t_list_tail, frequency=modified_frequency
+                ).astype(np.float32)
             else:
                 # Cannot subtract loops from the main waveform because then
                 # the main waveform would not have any loops remaining
@@ -664,9 +927,6 @@ class SinePulseImplementation(PulseImplementation):
         else:
             waveform_tail_array = None
 
-        # Reset pulse frequency to original
-        self.pulse.frequency = original_frequency
-
         if plot:
             plot = MatPlot(subplots=(2, 1), figsize=(10, 6), sharex=True)
 
@@ -675,10 +935,13 @@ class SinePulseImplementation(PulseImplementation):
             voltages = self.pulse.get_voltage(t_list)
             ax.add(t_list, voltages, color="C0")
 
-            # Add recreated sine pulse
-            wf_voltages_main = np.tile(waveform_array, waveform_loops)
-            wf_voltages_tail = waveform_tail_array
-            wf_voltages = np.hstack((wf_voltages_main, wf_voltages_tail))
+            # Add recreated sine pulse, filling a single preallocated array
+            main_points = len(waveform_array) * waveform_loops
+            tail_points = 0 if waveform_tail_array is None else len(waveform_tail_array)
+            wf_voltages = np.empty(main_points + tail_points, dtype=np.float32)
+            wf_voltages[:main_points].reshape(waveform_loops, -1)[:] = waveform_array
+            if tail_points:
+                wf_voltages[main_points:] = waveform_tail_array
             t_stop = self.pulse.t_start + len(wf_voltages) / sample_rate
             wf_t_list = self.pulse.t_start + np.arange(len(wf_voltages)) / sample_rate
             ax.add(wf_t_list, wf_voltages, marker="o", ms=2, color="C1")
@@ -688,10 +951,14 @@ class SinePulseImplementation(PulseImplementation):
             ax.plot(
                 wf_t_list[new_wf_idxs], wf_voltages[new_wf_idxs], "o", color="C2", ms=4
             )
-            wf_tail_idx = len(waveform_array) * waveform_loops
-            ax.plot(
-                wf_t_list[wf_tail_idx], wf_voltages[wf_tail_idx], "o", color="C3", ms=4
-            )
+            if tail_points:
+                ax.plot(
+                    wf_t_list[main_points],
+                    wf_voltages[main_points],
+                    "o",
+                    color="C3",
+                    ms=4,
+                )
             ax.set_ylabel("Amplitude (V)")
 
             ax = plot[1]
@@ -727,7 +994,7 @@ class FrequencyRampPulseImplementation(PulseImplementation):
         if len(t_list) < 320:
             raise RuntimeError("Waveform has fewer than minimum 320 points")
 
-        waveform_array = self.pulse.get_voltage(t_list)
+        waveform_array = self.pulse.get_voltage(t_list).astype(np.float32)
 
         return {
             "waveform": waveform_array,
@@ -1,6 +1,6 @@
 import numpy as np
 import logging
-from typing import List
+from typing import Dict, List
 
 from silq.instrument_interfaces import InstrumentInterface, Channel
 from silq.pulses import Pulse, SinePulse, PulseImplementation, TriggerPulse
@@ -16,6 +16,11 @@ RESET_PHASE = RESET_PHASE_FALSE
 DEFAULT_CH_INSTR = (0, 0, 0, 0, 0)
 DEFAULT_INSTR = DEFAULT_CH_INSTR + DEFAULT_CH_INSTR
 
+# Fixed instructions with all channels disabled
+WAIT_INSTR = DEFAULT_INSTR + (0, 'wait', 0, 100)
+BRANCH_INSTR = DEFAULT_INSTR + (0, 'branch', 0, 100)
+STOP_INSTR = DEFAULT_INSTR + (0, 'stop', 0, 100)
+
 
 class PulseBlasterDDSInterface(InstrumentInterface):
     """ Interface for the Pulseblaster DDS
@@ -103,25 +108,25 @@ class PulseBlasterDDSInterface(InstrumentInterface):
         #Initial pulseblaster commands
         self.instrument.setup()
 
-        # Set channel registers for frequencies, phases, and amplitudes
+        # Set channel registers for frequencies, phases, and amplitudes.
+        # The register indices and pulses (sorted by t_start) of each channel
+        # are stored for implementing the pulses
+        channel_register_idxs = {}
+        channel_pulses = {}
         for channel in self.instrument.output_channels:
-            frequencies = []
-            phases = []
-            amplitudes = []
-
-            pulses = self.pulse_sequence.get_pulses(
-                output_channel=channel.short_name)
+            pulses = sorted(self.pulse_sequence.get_pulses(
+                output_channel=channel.short_name),
+                key=lambda pulse: pulse.t_start)
             for pulse in pulses:
-                if isinstance(pulse, SinePulse):
-                    frequencies.append(pulse.frequency) # in MHz
-                    phases.append(pulse.phase)
-                    amplitudes.append(pulse.amplitude)
-                else:
+                if not isinstance(pulse, SinePulse):
                     raise NotImplementedError(f'{pulse} not implemented')
+            channel_pulses[channel.short_name] = pulses
 
-            frequencies = list(set(frequencies))
-            phases = list(set(phases))
-            amplitudes = list(set(amplitudes))
+            # Remove duplicates while preserving the order of the pulses
+            frequencies = list(dict.fromkeys(
+                pulse.frequency for pulse in pulses)) # in MHz
+            phases = list(dict.fromkeys(pulse.phase for pulse in pulses))
+            amplitudes = list(dict.fromkeys(pulse.amplitude for pulse in pulses))
 
             channel.frequencies(frequencies)
             channel.phases(phases)
@@ -133,81 +138,105 @@ class PulseBlasterDDSInterface(InstrumentInterface):
             self.instrument.set_amplitudes(amplitudes=amplitudes,
                                            channel=channel.idx)
 
+            channel_register_idxs[channel.short_name] = {
+                'frequencies': {frequency: k for k, frequency
+                                in enumerate(frequencies)},
+                'phases': {phase: k for k, phase in enumerate(phases)},
+                'amplitudes': {amplitude: k for k, amplitude
+                               in enumerate(amplitudes)}}
+
         s_to_ns = 1e9 # instruction delays expressed in ns
 
-        # Iteratively increase time
-        t = 0
+        # Times at which the channel outputs can change. The pulse sequence
+        # t_list is sorted and does not contain duplicates
         t_stop_max = max(self.pulse_sequence.t_stop_list)
-        inst_list = []
+        t_events = [t_val for t_val in self.pulse_sequence.t_list
+                    if 0 < t_val < t_stop_max]
+        if t_stop_max > 0:
+            t_events.insert(0, 0)
+
+        # Delay cycles until the next event. Delay durations that are too long
+        # are sent as a long_delay instruction
+        event_delay_cycles = np.rint(np.diff(t_events + [t_stop_max]) * s_to_ns)
+        event_delay_cycles = event_delay_cycles.astype(np.int64)
+        long_delays = event_delay_cycles >= 1e9
+        long_durations = event_delay_cycles - 100
+        # Integer ceil division of the long durations by the maximum delay
+        divisors = np.where(long_delays, -(-long_durations // 10**9), 1)
+        delays = long_durations // divisors
+
+        # Channel instruction slices at each event. Each pulse is implemented
+        # once, and the active pulse of each channel at every event is found
+        # by a single search over the pulse start times
+        t_events_array = np.array(t_events, dtype=float)
+        channel_event_instructions = []
+        for ch in sorted(self._output_channels):
+            pulses = channel_pulses[ch]
+            for pulse, next_pulse in zip(pulses[:-1], pulses[1:]):
+                if pulse.t_stop > next_pulse.t_start:
+                    raise RuntimeError(f'Pulses {pulse} and {next_pulse} '
+                                       f'overlap on channel {ch}')
+
+            pulse_instructions = [
+                pulse.implementation.implement(**channel_register_idxs[ch])
+                for pulse in pulses] + [DEFAULT_CH_INSTR]
+
+            # Last pulse starting at or before each event. Index -1 refers
+            # to DEFAULT_CH_INSTR, whose stop time ensures it is never active
+            t_starts = np.array([pulse.t_start for pulse in pulses], dtype=float)
+            t_stops = np.array([pulse.t_stop for pulse in pulses] + [-np.inf])
+            pulse_idxs = np.searchsorted(t_starts, t_events_array, side='right') - 1
+            # Use DEFAULT_CH_INSTR if the last started pulse has stopped
+            pulse_idxs[t_events_array >= t_stops[pulse_idxs]] = -1
+
+            channel_event_instructions.append(
+                [pulse_instructions[idx] for idx in pulse_idxs.tolist()])
 
+        inst_list = []
         if not self.is_primary():
             # Wait for trigger
-            inst_list.append(DEFAULT_INSTR + (0, 'wait', 0, 100))
+            inst_list.append(WAIT_INSTR)
 
-        while t < t_stop_max:
-            # find time of next event
-            t_next = min(t_val for t_val in self.pulse_sequence.t_list
-                         if t_val > t)
+        for channel_instructions, cycles, long_delay, divisor, delay in zip(
+                zip(*channel_event_instructions), event_delay_cycles.tolist(),
+                long_delays.tolist(), divisors.tolist(), delays.tolist()):
+            inst = [arg for channel_instruction in channel_instructions
+                    for arg in channel_instruction]
 
             # Send continue instruction until next event
-            delay_duration = t_next - t
-            delay_cycles = round(delay_duration * s_to_ns)
             # Either send continue command or long_delay command if the
             # delay duration is too long
-
-            inst = ()
-            # for each channel, search for active pulses and implement them
-            for ch in sorted(self._output_channels.keys()):
-                instrument_channel = self.instrument.output_channels[ch]
-
-                pulse = self.pulse_sequence.get_pulse(enabled=True,
-                                                      t=t,
-                                                      output_channel=ch)
-                if pulse is not None:
-                    pulse_implementation = pulse.implementation.implement(
-                        frequencies=instrument_channel.frequencies(),
-                        phases=instrument_channel.phases(),
-                        amplitudes=instrument_channel.amplitudes())
-                    inst = inst + pulse_implementation
-                else:
-                    inst = inst + DEFAULT_CH_INSTR
-
-            if delay_cycles < 1e9:
-                inst = inst + (0, 'continue', 0, delay_cycles)
+            if not long_delay:
+                inst.extend((0, 'continue', 0, cycles))
             else:
                 # TODO: check to see if a call to long_delay sets the channel registers
-                duration = round(delay_cycles - 100)
-                divisor = int(np.ceil(duration / 1e9))
-                delay = int(duration / divisor)
-                inst = inst + (0, 'long_delay', divisor, delay)
+                inst.extend((0, 'long_delay', divisor, delay))
 
-            inst_list.append(inst)
-
-            t = t_next
+            inst_list.append(tuple(inst))
 
         if self.is_primary():
-            # Insert delay until end of pulse sequence
+            # Insert delay until end of pulse sequence, compared in integer cycles
             # NOTE: This will disable all output channels and use default registers
-            delay_duration = self.pulse_sequence.duration + self.pulse_sequence.final_delay - t
-            if delay_duration > 1e-11:
-                delay_cycles = round(delay_duration * s_to_ns)
+            t_final = self.pulse_sequence.duration + self.pulse_sequence.final_delay
+            delay_cycles = round((t_final - t_stop_max) * s_to_ns)
+            if delay_cycles > 0:
                 if delay_cycles < 1e9:
-                    inst = DEFAULT_INSTR + (0, 'continue', 0, delay_cycles)
+                    inst = (*DEFAULT_INSTR, 0, 'continue', 0, delay_cycles)
                 else:
                     # TODO: check to see if a call to long_delay sets the channel registers
-                    duration = round(delay_cycles - 100)
-                    divisor = int(np.ceil(duration / 1e9))
-                    delay = int(duration / divisor)
-                    inst = DEFAULT_INSTR + (0, 'long_delay', divisor, delay)
+                    duration = delay_cycles - 100
+                    divisor = -(-duration // 10**9)
+                    delay = duration // divisor
+                    inst = (*DEFAULT_INSTR, 0, 'long_delay', divisor, delay)
 
                 inst_list.append(inst)
 
         if repeat:
             # Loop back to beginning (wait if not primary)
-            inst_list.append(DEFAULT_INSTR + (0, 'branch', 0, 100))
+            inst_list.append(BRANCH_INSTR)
         else:
             # Stop pulse sequence
-            inst_list.append(DEFAULT_INSTR + (0, 'stop', 0, 100))
+            inst_list.append(STOP_INSTR)
 
 
         # Note that this command does not actually send anything to the DDS,
@@ -234,15 +263,24 @@ class PulseBlasterDDSInterface(InstrumentInterface):
 class SinePulseImplementation(PulseImplementation):
     pulse_class = SinePulse
 
-    def implement(self, frequencies, phases, amplitudes):
-        frequency_idx = frequencies.index(self.pulse.frequency) # MHz
-        phase_idx = phases.index(self.pulse.phase)
-        amplitude_idx = amplitudes.index(self.pulse.amplitude)
+    def implement(self,
+                  frequencies: Dict[float, int],
+                  phases: Dict[float, int],
+                  amplitudes: Dict[float, int]) -> tuple:
+        """Implement pulse as channel instruction
 
-        inst_slice = (
-            frequency_idx,
-            phase_idx,
-            amplitude_idx,
+        Args:
+            frequencies: Register index of each channel frequency (MHz)
+            phases: Register index of each channel phase
+            amplitudes: Register index of each channel amplitude
+
+        Returns:
+            Channel instruction slice
+        """
+        pulse = self.pulse
+        return (
+            frequencies[pulse.frequency], # MHz
+            phases[pulse.phase],
+            amplitudes[pulse.amplitude],
             1, # Enable channel
-            RESET_PHASE)
-        return inst_slice
\ No newline at end of file
+            RESET_PHASE)
\ No newline at end of file
@@ -101,9 +101,10 @@ class PulseBlasterESRPROInterface(InstrumentInterface):
         # Determine signal to send when all channels are inactive (low).
         # This is not necessarily zero, as some channels are triggered when the
         # channel voltage is below a threshold (e.g. PB DDS instrument).
-        inactive_channel_mask = sum(2**connection.output['channel'].id
-                                    if connection.input['channel'].invert else 0
-                                    for connection in output_connections)
+        inactive_channel_mask = 0
+        for connection in output_connections:
+            if connection.input['channel'].invert:
+                inactive_channel_mask |= 1 << connection.output['channel'].id
         if inactive_channel_mask != 0:
             # Some channels must have high signal to not trigger it.
             # Wait instructions must be preceded by another instruction.
@@ -112,54 +113,79 @@ class PulseBlasterESRPROInterface(InstrumentInterface):
             # Wait for software trigger (another call to pulseblaster.start())
             instructions.append((inactive_channel_mask, 'wait', 0, 100))
 
-        # Iteratively increase time
-        t = 0
+        # Times at which the channel outputs can change. The pulse sequence
+        # t_list is sorted and does not contain duplicates
         t_stop_max = max(self.pulse_sequence.t_stop_list)
-
-        while t < t_stop_max:
-            channel_mask = sum(pulse.implementation.implement(t=t)
-                               for pulse in self.pulse_sequence)
-
+        t_events = [t_val for t_val in self.pulse_sequence.t_list
+                    if 0 < t_val < t_stop_max]
+        if t_stop_max > 0:
+            t_events.insert(0, 0)
+
+        # Wait cycles until the next event. Wait durations that are too long
+        # are split into a continue and a long_delay instruction
+        event_wait_cycles = np.rint(np.diff(t_events + [t_stop_max]) * sample_rate)
+        event_wait_cycles = event_wait_cycles.astype(np.int64)
+        long_delays = event_wait_cycles >= 1e9
+        long_durations = event_wait_cycles - 100
+        # Integer ceil division of the long durations by the maximum delay
+        divisors = np.where(long_delays, -(-long_durations // 10**9), 1)
+        delays = long_durations // divisors
+
+        # Pulse properties are extracted once, such that the channel mask at
+        # each event can be determined without calling every pulse
+        # implementation. See `TriggerPulseImplementation.implement`
+        pulses = self.pulse_sequence.enabled_pulses
+        pulse_t_starts = np.array([pulse.t_start for pulse in pulses])
+        pulse_t_stops = np.array([pulse.t_stop for pulse in pulses])
+        pulse_channel_values = np.array(
+            [1 << pulse.connection.output['channel'].id for pulse in pulses],
+            dtype=np.int64)
+        pulse_inverts = np.array(
+            [bool(pulse.connection.input['channel'].invert) for pulse in pulses],
+            dtype=bool)
+
+        # Channel mask at each event (rows) from the active pulses (columns).
+        # Inverted channels are high when their pulse is not active
+        t_events_array = np.array(t_events, dtype=float)[:, np.newaxis]
+        active = (pulse_t_starts <= t_events_array) & (t_events_array < pulse_t_stops)
+        channel_masks = np.where(active != pulse_inverts,
+                                 pulse_channel_values, 0).sum(axis=1)
+
+        # Start times of input pulses that require waiting for a software trigger
+        # TODO check for better way to check active input pulses
+        trigger_wait_times = {pulse.t_start
+                              for pulse in self.input_pulse_sequence.get_pulses()
+                              if isinstance(pulse, TriggerWaitPulse)}
+
+        for t, channel_mask, cycles, long_delay, divisor, delay in zip(
+                t_events, channel_masks.tolist(), event_wait_cycles.tolist(),
+                long_delays.tolist(), divisors.tolist(), delays.tolist()):
             # Check for input pulses, such as waiting for software trigger
-            # TODO check for better way to check active input pulses
-            active_input_pulses = self.input_pulse_sequence.get_pulses(t_start=t)
-            if [p for p in active_input_pulses
-                if isinstance(p, TriggerWaitPulse)]:
+            if t in trigger_wait_times:
                 instructions.append((inactive_channel_mask, 'wait', 0, 50))
 
-            # find time of next event
-            t_next = min(t_val for t_val in self.pulse_sequence.t_list
-                         if t_val > t)
-
             # Send wait instruction until next event
-            wait_duration = t_next - t
-            wait_cycles = round(wait_duration * sample_rate)
             # Either send continue command or long_delay command if the
             # wait duration is too long
-            if wait_cycles < 1e9:
-                instructions.append((channel_mask, 'continue', 0, wait_cycles))
+            if not long_delay:
+                instructions.append((channel_mask, 'continue', 0, cycles))
             else:
                 instructions.append((channel_mask, 'continue', 0, 100))
-                duration = round(wait_cycles - 100)
-                divisor = int(np.ceil(duration / 1e9))
-                delay = int(duration / divisor)
                 instructions.append((channel_mask, 'long_delay', divisor, delay))
 
-            t = t_next
-
         # Add final instructions
-        # Wait until end of pulse sequence
-        wait_duration = self.pulse_sequence.duration + self.pulse_sequence.final_delay - t
+        # Wait until end of pulse sequence, compared in integer cycles
+        t_final = self.pulse_sequence.duration + self.pulse_sequence.final_delay
+        wait_cycles = round((t_final - t_stop_max) * sample_rate)
 
-        if wait_duration > 0:
-            wait_cycles = round(wait_duration * sample_rate)
+        if wait_cycles > 0:
             if wait_cycles < 1e9:
                 instructions.append((inactive_channel_mask, 'continue', 0, wait_cycles))
             else:
                 instructions.append((inactive_channel_mask, 'continue', 0, 100))
-                duration = round(wait_cycles - 100)
-                divisor = int(np.ceil(duration / 1e9))
-                delay = int(duration / divisor)
+                duration = wait_cycles - 100
+                divisor = -(-duration // 10**9)
+                delay = duration // divisor
                 instructions.append((inactive_channel_mask, 'long_delay', divisor, delay))
 
         if repeat:
@@ -200,14 +226,12 @@ class TriggerPulseImplementation(PulseImplementation):
         return targeted_pulse
 
     def implement(self, t):
-        output_channel = self.pulse.connection.output['channel']
-        input_channel = self.pulse.connection.input['channel']
-        channel_value = 2 ** output_channel.id
+        channel_value = 1 << self.pulse.connection.output['channel'].id
+        invert = bool(self.pulse.connection.input['channel'].invert)
 
-        if self.pulse.t_start <= t < self.pulse.t_stop:
-            return 0 if input_channel.invert else channel_value
-        else:
-            return channel_value if input_channel.invert else 0
+        # Inverted channels are high when the pulse is not active
+        active = self.pulse.t_start <= t < self.pulse.t_stop
+        return channel_value if active != invert else 0
 
 
 class MarkerPulseImplementation(PulseImplementation):
@@ -220,11 +244,9 @@ class MarkerPulseImplementation(PulseImplementation):
         return targeted_pulse
 
     def implement(self, t):
-        output_channel = self.pulse.connection.output['channel']
-        input_channel = self.pulse.connection.input['channel']
-        channel_value = 2 ** output_channel.id
+        channel_value = 1 << self.pulse.connection.output['channel'].id
+        invert = bool(self.pulse.connection.input['channel'].invert)
 
-        if self.pulse.t_start <= t < self.pulse.t_stop:
-            return 0 if input_channel.invert else channel_value
-        else:
-            return channel_value if input_channel.invert else 0
+        # Inverted channels are high when the pulse is not active
+        active = self.pulse.t_start <= t < self.pulse.t_stop
+        return channel_value if active != invert else 0
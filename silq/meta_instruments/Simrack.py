@@ -23,25 +23,36 @@ class Simrack(Instrument):
             #Find alphabetic character for each SIM instrument
             SIM_letter = chr(SIM_idx + ord('A'))
             for channel in range(1, SIM.channels+1):
-                self.add_parameter('ch{}{}'.format(SIM_letter, channel),
-                                   label='Corrected Gate Channel {}{} (V)'.format(SIM_letter, channel),
-                                   get_cmd=partial(self.do_get_voltage,channel=channel, SIM_letter=SIM_letter),
-                                   set_cmd=partial(self.do_set_voltage, channel=channel, SIM_letter=SIM_letter))
+                # Divider is added first, such that the voltage parameter can
+                # directly refer to it
                 self.add_parameter('ch{}{}_divider'.format(SIM_letter, channel),
                                    label='Gate Channel {} divider'.format(channel),
                                    parameter_class=ManualParameter,
                                    initial_value=1
                                    )
+                SIM_parameter, divider_parameter = self._get_SIM_parameters(
+                    SIM_letter, channel)
+                self.add_parameter('ch{}{}'.format(SIM_letter, channel),
+                                   label='Corrected Gate Channel {}{} (V)'.format(SIM_letter, channel),
+                                   get_cmd=partial(self._get_voltage,
+                                                   SIM_parameter, divider_parameter),
+                                   set_cmd=partial(self._set_voltage,
+                                                   SIM_parameter, divider_parameter))
+
+    def _get_SIM_parameters(self, SIM_letter, channel):
+        SIM = self.SIMs[ord(SIM_letter) - ord('A')]
+        return (SIM.parameters['ch{}'.format(channel)],
+                self.parameters['ch{}{}_divider'.format(SIM_letter, channel)])
 
     def do_get_voltage(self, SIM_letter, channel):
-        SIM_idx = ord(SIM_letter) - ord('A')
-        SIM = self.SIMs[SIM_idx]
-        raw_voltage = eval('SIM.ch{}()'.format(channel))
-        divider = eval('self.ch{}{}_divider()'.format(SIM_letter, channel))
-        return raw_voltage/divider
+        return self._get_voltage(*self._get_SIM_parameters(SIM_letter, channel))
 
     def do_set_voltage(self, voltage, SIM_letter, channel):
-        SIM_idx = ord(SIM_letter) - ord('A')
-        SIM = self.SIMs[SIM_idx]
-        divider = eval('self.ch{}{}_divider()'.format(SIM_letter, channel))
-        eval('SIM.ch{}({})'.format(channel, voltage * divider))
\ No newline at end of file
+        self._set_voltage(*self._get_SIM_parameters(SIM_letter, channel),
+                          voltage)
+
+    def _get_voltage(self, SIM_parameter, divider_parameter):
+        return SIM_parameter() / divider_parameter()
+
+    def _set_voltage(self, SIM_parameter, divider_parameter, voltage):
+        SIM_parameter(voltage * divider_parameter())
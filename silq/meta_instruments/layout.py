@@ -2,10 +2,12 @@ import os
 import numpy as np
 from collections import OrderedDict as od, Iterable
 import logging
+import operator
 from copy import copy
+from itertools import islice
 import pickle, dill
 from time import sleep, time
-from typing import Union, List, Sequence, Dict, Any
+from typing import Union, List, Sequence, Dict, Any, Iterator
 import h5py
 from pathlib import Path
 
@@ -111,13 +113,13 @@ class Connection:
             input_instrument = input_interface.instrument_name()
 
         # Change instruments and channels into lists
-        if not (output_instrument is None or type(output_instrument) is list):
+        if not (output_instrument is None or isinstance(output_instrument, list)):
             output_instrument = [output_instrument]
-        if not (input_instrument is None or type(input_instrument) is list):
+        if not (input_instrument is None or isinstance(input_instrument, list)):
             input_instrument = [input_instrument]
-        if not (output_channel is None or type(output_channel) is list):
+        if not (output_channel is None or isinstance(output_channel, list)):
             output_channel = [output_channel]
-        if not (input_channel is None or type(input_channel) is list):
+        if not (input_channel is None or isinstance(input_channel, list)):
             input_channel = [input_channel]
 
         # If channel is an object, convert to its name
@@ -328,23 +330,28 @@ class CombinedConnection(Connection):
         super().__init__(scale=scale, label=label)
         self.connections = connections
 
-        self.output['str'] = [connection.output['str']
-                              for connection in connections]
-        self.output['instruments'] = list(set([connection.output['instrument']
-                                               for connection in connections]))
+        # Collect args, and ordered unique instruments and channels, of the
+        # underlying connections in a single pass
+        self.output['str'], self.input['str'] = [], []
+        output_instruments, output_channels = {}, {}
+        input_instruments, input_channels = {}, {}
+        for connection in connections:
+            self.output['str'].append(connection.output['str'])
+            output_instruments[connection.output['instrument']] = None
+            output_channels[connection.output['channel']] = None
+            self.input['str'].append(connection.input['str'])
+            input_instruments[connection.input['instrument']] = None
+            input_channels[connection.input['channel']] = None
+
+        self.output['instruments'] = list(output_instruments)
         if len(self.output['instruments']) == 1:
             self.output['instrument'] = self.output['instruments'][0]
-            self.output['channels'] = list(set([connection.output['channel']
-                                                for connection in connections]))
+            self.output['channels'] = list(output_channels)
 
-        self.input['str'] = [connection.input['str']
-                             for connection in connections]
-        self.input['instruments'] = list(set([connection.input['instrument']
-                                              for connection in connections]))
+        self.input['instruments'] = list(input_instruments)
         if len(self.input['instruments']) == 1:
             self.input['instrument'] = self.input['instruments'][0]
-            self.input['channels'] = list(set([connection.input['channel']
-                                               for connection in connections]))
+            self.input['channels'] = list(input_channels)
 
         self.trigger = False
         self.trigger_start = False
@@ -513,6 +520,12 @@ class Layout(Instrument):
                             for interface in instrument_interfaces}
 
         self.connections = []
+        # Connections indexed by output and input instrument, created lazily
+        # by _get_candidate_connections
+        self._connections_index = None
+        # Connections of pulses, keyed by their connection label and
+        # requirements, created lazily by get_pulse_connection
+        self._pulse_connections = None
 
         self.add_parameter('instruments',
                            get_cmd=lambda: list(self._interfaces.keys()),
@@ -655,11 +668,16 @@ class Layout(Instrument):
               creating the Layout.
 
         """
-        output_instrument, output_channel_name = output_arg.split('.')
+        for arg in [output_arg, input_arg]:
+            if '.' not in arg:
+                raise ValueError(f'Connection arg {arg} must have form '
+                                 f'"{{instrument}}.{{channel}}"')
+
+        output_instrument, _, output_channel_name = output_arg.partition('.')
         output_interface = self._interfaces[output_instrument]
         output_channel = output_interface.get_channel(output_channel_name)
 
-        input_instrument, input_channel_name = input_arg.split('.')
+        input_instrument, _, input_channel_name = input_arg.partition('.')
         input_interface = self._interfaces[input_instrument]
         input_channel = input_interface.get_channel(input_channel_name)
 
@@ -669,6 +687,8 @@ class Layout(Instrument):
                                       input_channel=input_channel,
                                       **kwargs)
         self.connections += [connection]
+        self._connections_index = None
+        self._pulse_connections = None
         return connection
 
     def combine_connections(self,
@@ -690,6 +710,8 @@ class Layout(Instrument):
         """
         connection = CombinedConnection(connections=connections, **kwargs)
         self.connections.append(connection)
+        self._connections_index = None
+        self._pulse_connections = None
         return connection
 
     def load_connections(self, filepath: Union[str, None] = None,
@@ -714,6 +736,8 @@ class Layout(Instrument):
             Write documentation/function for how to create JSON connection list.
         """
         self.connections.clear()
+        self._connections_index = None
+        self._pulse_connections = None
         if filepath is not None:
             import os, json
             if not os.path.isabs(filepath):
@@ -748,6 +772,61 @@ class Layout(Instrument):
 
         return self.connections
 
+    def _connections_changed(self, connections: tuple) -> bool:
+        """Whether connections differ from the current ``Layout.connections``
+
+        Since ``Layout.connections`` is a public list, it can also be modified
+        directly, e.g. by replacing a connection. Connections are therefore
+        compared by identity, rather than by only comparing their number.
+
+        Args:
+            connections: Connections from which a cache was created
+
+        Returns:
+            True if any connection has been added, removed or replaced
+        """
+        return (len(connections) != len(self.connections)
+                or not all(map(operator.is_, connections, self.connections)))
+
+    def _get_candidate_connections(self,
+                                   output_instrument: str = None,
+                                   input_instrument: str = None
+                                   ) -> List[Connection]:
+        """Get connections that can have a given output/input instrument
+
+        Connections are indexed by their output and input instrument, such
+        that not every connection needs to be checked by `get_connections`.
+        The index is recreated whenever ``Layout.connections`` changes.
+
+        Args:
+            output_instrument: Name of output instrument. Ignored if not a str
+            input_instrument: Name of input instrument. Ignored if not a str
+
+        Returns:
+            Connections, in order of ``Layout.connections``, that should
+            still be checked via ``Connection.satisfies_conditions``.
+        """
+        if (self._connections_index is None
+                or self._connections_changed(self._connections_index[0])):
+            output_index, input_index = {}, {}
+            for connection in self.connections:
+                output_index.setdefault(connection.output.get('instrument'),
+                                        []).append(connection)
+                input_index.setdefault(connection.input.get('instrument'),
+                                       []).append(connection)
+            self._connections_index = (tuple(self.connections),
+                                       output_index, input_index)
+        _, output_index, input_index = self._connections_index
+
+        connections = self.connections
+        if isinstance(output_instrument, str):
+            connections = output_index.get(output_instrument, [])
+        if isinstance(input_instrument, str):
+            input_connections = input_index.get(input_instrument, [])
+            if len(input_connections) < len(connections):
+                connections = input_connections
+        return connections
+
     def get_connections(self,
                         connection: Connection = None,
                         output_arg: str = None,
@@ -820,25 +899,71 @@ class Layout(Instrument):
             else:
                 raise RuntimeError(f"{connection} not found in connections")
         else:
-            satisfied_connections = []
-            for connection in self.connections:
-                if connection.satisfies_conditions(
-                        connection=connection,
-                        output_arg=output_arg,
-                        output_interface=output_interface,
-                        output_instrument=output_instrument,
-                        output_channel=output_channel,
-                        input_arg=input_arg,
-                        input_interface=input_interface,
-                        input_instrument=input_instrument,
-                        input_channel=input_channel,
-                        trigger=trigger,
-                        trigger_start=trigger_start,
-                        acquire=acquire,
-                        software=software):
-                    satisfied_connections.append(connection)
-
-            return satisfied_connections
+            return list(self._iter_connections(output_arg=output_arg,
+                                               output_interface=output_interface,
+                                               output_instrument=output_instrument,
+                                               output_channel=output_channel,
+                                               input_arg=input_arg,
+                                               input_interface=input_interface,
+                                               input_instrument=input_instrument,
+                                               input_channel=input_channel,
+                                               trigger=trigger,
+                                               trigger_start=trigger_start,
+                                               acquire=acquire,
+                                               software=software))
+
+    def _iter_connections(self,
+                          output_interface: InstrumentInterface = None,
+                          output_instrument: Instrument = None,
+                          input_interface: InstrumentInterface = None,
+                          input_instrument: Instrument = None,
+                          **conditions) -> Iterator[Connection]:
+        """Iterate over connections that satisfy connection conditions
+
+        Connections are checked one at a time, such that callers that only
+        need the first few matching connections can stop early.
+
+        Args:
+            output_interface: Connections must have output_interface object
+            output_instrument: name of output instrument
+            input_interface: Connections must have input_interface object
+            input_instrument: Connections must have input_instrument name
+            **conditions: Remaining conditions of `Layout.get_connections`
+
+        Yields:
+            Connections that satisfy conditions, in order of
+            ``Layout.connections``
+        """
+        if output_interface is not None:
+            output_instrument = output_interface.instrument_name()
+        if input_interface is not None:
+            input_instrument = input_interface.instrument_name()
+
+        # Only pass conditions that are set, such that each connection
+        # does not need to process unused conditions
+        conditions = {key: val for key, val in conditions.items()
+                      if val is not None}
+        if output_instrument is not None:
+            conditions['output_instrument'] = output_instrument
+        if input_instrument is not None:
+            conditions['input_instrument'] = input_instrument
+
+        # Convert Channel objects to their names once, instead of for each
+        # connection in satisfies_conditions
+        for key in ['output_channel', 'input_channel']:
+            channel = conditions.get(key)
+            if isinstance(channel, Channel):
+                conditions[key] = channel.name
+            elif isinstance(channel, list):
+                conditions[key] = [ch.name if isinstance(ch, Channel) else ch
+                                   for ch in channel]
+
+        candidate_connections = self._get_candidate_connections(
+            output_instrument=output_instrument,
+            input_instrument=input_instrument)
+        for connection in candidate_connections:
+            if connection.satisfies_conditions(**conditions):
+                yield connection
 
     def get_connection(self,
                        connection_label: str = None,
@@ -923,7 +1048,10 @@ class Layout(Instrument):
                               trigger_start=trigger_start,
                               acquire=acquire,
                               software=software)
-            connections = self.get_connections(**conditions)
+            # A second match suffices to know the connection is not unique
+            connections = list(islice(self._iter_connections(**conditions), 2))
+            if len(connections) > 1:
+                connections = self.get_connections(**conditions)
             filtered_conditions = {key: val for key, val in conditions.items()
                                    if val is not None}
             assert len(connections) == 1, \
@@ -938,7 +1066,9 @@ class Layout(Instrument):
             interface.is_primary(instrument_name == primary_instrument)
 
     def _get_interfaces_hierarchical(
-            self, sorted_interfaces: List[InstrumentInterface] = []):
+            self,
+            sorted_interfaces: List[InstrumentInterface] = [],
+            input_instruments: Dict[str, set] = None):
         """Sort interfaces by triggering order, from bottom to top.
 
         This sorting ensures that earlier instruments never trigger later ones.
@@ -947,6 +1077,9 @@ class Layout(Instrument):
         Args:
             sorted_interfaces: Sorted list of interfaces. Should start empty,
                 and is filled recursively.
+            input_instruments: Names of input instruments of each
+                instrument's output connections. Should start as None, in
+                which case it is determined once and passed on recursively.
 
         Returns:
             Hierarchically sorted list of interfaces.
@@ -968,6 +1101,14 @@ class Layout(Instrument):
             else:
                 sorted_interfaces = []
 
+        if input_instruments is None:
+            input_instruments = {
+                instrument: {connection.input['instrument']
+                             for connection in self.get_connections(
+                                output_instrument=instrument)
+                             if 'instrument' in connection.input}
+                for instrument in self._interfaces}
+
         # Find all interfaces that have not been sorted yet
         remaining_interfaces = {
             instrument: interface
@@ -979,18 +1120,10 @@ class Layout(Instrument):
             return sorted_interfaces
 
         for instrument, interface in remaining_interfaces.items():
-            output_connections = self.get_connections(
-                output_interface=interface)
-
-            # Find instruments that have this instrument as an input
-            input_instruments = {connection.input['instrument']
-                                 for connection in output_connections
-                                 if 'instrument' in connection.input}
-
             # Add interface to sorted interface if it does not trigger any of
             # the remaining interfaces
-            if all(instrument not in remaining_interfaces
-                   for instrument in input_instruments):
+            if all(input_instrument not in remaining_interfaces
+                   for input_instrument in input_instruments[instrument]):
                 sorted_interfaces.append(interface)
 
         # Ensure that we are not in an infinite loop
@@ -1001,7 +1134,8 @@ class Layout(Instrument):
                                  "triggering each other")
 
         # Go to next level in recursion
-        return self._get_interfaces_hierarchical(sorted_interfaces)
+        return self._get_interfaces_hierarchical(sorted_interfaces,
+                                                 input_instruments)
 
     def get_pulse_connection(self,
                              pulse: Pulse,
@@ -1037,6 +1171,26 @@ class Layout(Instrument):
         elif instrument is not None:
             connection_requirements['output_instrument'] = instrument
 
+        # Pulses usually share a few distinct connection requirements, so the
+        # resulting connection is cached. Lists are converted to tuples, and
+        # requirements that still cannot be hashed are not cached.
+        try:
+            key = (pulse.connection_label,) + tuple(
+                tuple(sorted((name, tuple(val) if isinstance(val, list) else val)
+                             for name, val in conditions.items()))
+                for conditions in [connection_requirements, kwargs])
+            hash(key)
+        except TypeError:
+            key = None
+
+        if (self._pulse_connections is None
+                or self._connections_changed(self._pulse_connections[0])):
+            # Connections have changed, cached pulse connections are invalid
+            self._pulse_connections = (tuple(self.connections), {})
+        pulse_connections = self._pulse_connections[1]
+        if key in pulse_connections:
+            return pulse_connections[key]
+
         if pulse.connection_label is not None:
             connection = self.get_connection(
                 connection_label=pulse.connection_label,
@@ -1045,6 +1199,9 @@ class Layout(Instrument):
         else:
             connection = self.get_connection(**connection_requirements,
                                              **kwargs)
+
+        if key is not None:
+            pulse_connections[key] = connection
         return connection
 
     def _target_pulse(self,
@@ -1141,7 +1298,7 @@ class Layout(Instrument):
             * If a measurement is running, all instruments are stopped
             * The original pulse sequence and pulses remain unmodified
         """
-        logger.info(f'Targeting {pulse_sequence}')
+        logger.info('Targeting %s', pulse_sequence)
 
         if pulse_sequence.duration > self.maximum_pulse_sequence_duration:
             raise RuntimeError(
@@ -1178,7 +1335,7 @@ class Layout(Instrument):
 
         # Clear pulses sequences of all instruments
         for interface in self._interfaces.values():
-            logger.debug(f'Initializing interface {interface.name}')
+            logger.debug('Initializing interface %s', interface.name)
             interface.initialize()
 
             # Fix duration of pulse sequence and input pulse sequence
@@ -1224,7 +1381,7 @@ class Layout(Instrument):
 
                 os.makedirs(os.path.dirname(filepath), exist_ok=True)
 
-                logger.debug(f'Storing pulse sequence to {filepath}')
+                logger.debug('Storing pulse sequence to %s', filepath)
                 with open(filepath, 'wb') as f:
                     dill.dump(self._pulse_sequence, f)
             except:
@@ -1459,7 +1616,7 @@ class Layout(Instrument):
             `Layout.save_traces`
         """
         try:
-            logger.info(f'Performing acquisition, {"stop" if stop else "continue"]} when finished')
+            logger.info(f'Performing acquisition, {"stop" if stop else "continue"} when finished')
             if not self.active():
                 self.start()
 
@@ -1475,13 +1632,13 @@ class Layout(Instrument):
             # current output is pulse_traces[pulse_name][acquisition_channel]
             # needs to be converted to data[pulse_name][output_label]
             # where output_label is taken from self.acquisition_channels()
+            # Keep first label if a channel occurs multiple times
+            output_labels = {channel: label for channel, label
+                             in reversed(self.acquisition_channels())}
             data = {}
             for pulse, channel_traces in pulse_traces.items():
-                data[pulse] = {}
-                for channel, trace in channel_traces.items():
-                    output_label = next(item[1] for item in self.acquisition_channels()
-                                        if item[0] == channel)
-                    data[pulse][output_label] = trace
+                data[pulse] = {output_labels[channel]: trace
+                               for channel, trace in channel_traces.items()}
 
             if save_traces:
                 self.save_traces()
@@ -1552,14 +1709,37 @@ class Layout(Instrument):
             data_shape = data_shape[active_measurement.action_indices]
         # Data is saved in chunks, which is one acquisition
         data_shape += (self.samples(), self.acquisition_interface.points_per_trace())
-        for channel in channels:
-            file['traces'].create_dataset(name=channel, shape=data_shape,
-                                          dtype=float, scaleoffset=precision,
-                                          chunks=True, compression='gzip',
-                                          compression_opts=compression)
+        self._create_trace_datasets(file['traces'], channels=channels,
+                                    shape=data_shape, precision=precision,
+                                    compression=compression)
         file.flush()
         return file
 
+    @staticmethod
+    def _create_trace_datasets(group: h5py.Group,
+                               channels: List[str],
+                               shape: tuple,
+                               precision: Union[int, None] = 3,
+                               compression: int = 4):
+        """Create an HDF5 trace dataset for each channel
+
+        Args:
+            group: HDF5 group in which to create datasets
+            channels: Channel labels, used as dataset names
+            shape: Shape of each dataset
+            precision: Number of digits after the decimal points to retain.
+                Set to 0 for lossless compression
+            compression: gzip compression level, min=0, max=9
+        """
+        # Traces are rounded to a limited precision, in which case single
+        # precision suffices and halves the data passed through HDF5 filters
+        dtype = np.float32 if precision else float
+        for channel in channels:
+            group.create_dataset(name=channel, shape=shape,
+                                 dtype=dtype, scaleoffset=precision,
+                                 chunks=True, compression='gzip',
+                                 compression_opts=compression)
+
     def save_traces(self,
                     name: str = None,
                     folder: str = None,
@@ -1597,16 +1777,21 @@ class Layout(Instrument):
         if name in self.trace_files:  # Use existing trace file
             trace_file = self.trace_files[name]
         else:  # Create new trace file
-            trace_file = self.initialize_trace_file(name=name, folder=folder)
+            trace_file = self.initialize_trace_file(name=name, folder=folder,
+                                                    precision=precision,
+                                                    compression=compression)
             self.trace_files[name] = trace_file
 
         traces = self.acquisition_interface.traces
+        # Map channel labels to acquisition output channel names (chA etc.),
+        # keeping the first channel name if a label occurs multiple times
+        channel_names = {label: ch for ch, label
+                         in reversed(self.acquisition_channels())}
+        traces_group = trace_file['traces']
+        loop_indices = active_measurement.loop_indices
         for channel in channels:
-            # Get corresponding acquisition output channel name (chA etc.)
-            ch = next(ch_pair[0] for ch_pair in self.acquisition_channels()
-                      if ch_pair[1] == channel)
-            trace_file['traces'][channel][active_measurement.loop_indices] = traces[ch]
-        trace_file.attrs['final_loop_indices'] = active_measurement.loop_indices
+            traces_group[channel][loop_indices] = traces[channel_names[channel]]
+        trace_file.attrs['final_loop_indices'] = loop_indices
 
         return trace_file
 
@@ -158,12 +158,9 @@ class AcquisitionParameter(SettingsClass, MultiParameter):
     def __repr__(self):
         return f'{self.name} acquisition parameter'
 
-    def __getattribute__(self, item):
-        try:
-            return super().__getattribute__(item)
-        except AttributeError:
-            return attribute_from_config(
-                item, config=config.properties)
+    def __getattr__(self, item):
+        # Only called if regular attribute lookup raises an AttributeError
+        return attribute_from_config(item, config=config.properties)
 
     def __setattr__(self, key, value):
         super().__setattr__(key, value)
@@ -1904,31 +1901,41 @@ class NMRParameter(AcquisitionParameter):
         single_read_traces = traces[single_read_traces_name]['output']
         points_per_shot = single_read_traces.shape[1]
 
-        self.read_traces = np.zeros((len(self.ESR_frequencies), self.samples,
-                                     self.ESR['shots_per_frequency'],
-                                     points_per_shot))
-        up_proportions = np.zeros((len(self.ESR_frequencies), self.samples))
-        for f_idx, ESR_frequency in enumerate(self.ESR_frequencies):
-            for sample in range(self.samples):
-                # Create array containing all read traces
-                read_traces = np.zeros(
-                    (self.ESR['shots_per_frequency'], points_per_shot))
-                for shot_idx in range(self.ESR['shots_per_frequency']):
-                    # Read traces of different frequencies are interleaved
-                    traces_idx = f_idx + shot_idx * len(self.ESR_frequencies)
-                    traces_name = f"{self.ESR['read_pulse'].name}[{traces_idx}]"
-                    read_traces[shot_idx] = traces[traces_name]['output'][sample]
-                self.read_traces[f_idx, sample] = read_traces
+        # Retrieve settings once, as they are otherwise retrieved (and
+        # ESR_frequencies recomputed) for every sample and shot
+        ESR_frequencies = self.ESR_frequencies
+        samples = self.samples
+        shots_per_frequency = self.ESR['shots_per_frequency']
+        read_pulse_name = self.ESR['read_pulse'].name
+        sample_rate = self.sample_rate
+        t_read = self.t_read
+        t_skip = self.t_skip
+
+        # Every read trace is filled in below, so no need to initialize
+        self.read_traces = np.empty((len(ESR_frequencies), samples,
+                                     shots_per_frequency, points_per_shot))
+        up_proportions = np.zeros((len(ESR_frequencies), samples))
+        for f_idx, ESR_frequency in enumerate(ESR_frequencies):
+            # Read traces of different frequencies are interleaved
+            frequency_traces = [
+                traces[f"{read_pulse_name}[{f_idx + shot_idx * len(ESR_frequencies)}]"]['output']
+                for shot_idx in range(shots_per_frequency)]
+            for sample in range(samples):
+                # Fill read traces of all shots directly into self.read_traces,
+                # and analyse that view instead of a separate copy
+                read_traces = self.read_traces[f_idx, sample]
+                for shot_idx, shot_traces in enumerate(frequency_traces):
+                    read_traces[shot_idx] = shot_traces[sample]
                 read_result = analysis.analyse_traces(
                     traces=read_traces,
-                    sample_rate=self.sample_rate,
-                    t_read=self.t_read,
-                    t_skip=self.t_skip,
+                    sample_rate=sample_rate,
+                    t_read=t_read,
+                    t_skip=t_skip,
                     threshold_voltage=threshold_voltage)
                 up_proportions[f_idx, sample] = read_result['up_proportion']
                 results['results_read'].append(read_result)
 
-            if len(self.ESR_frequencies) > 1:
+            if len(ESR_frequencies) > 1:
                 results[f'up_proportions_{f_idx}'] = up_proportions[f_idx]
             else:
                 results['up_proportions'] = up_proportions[f_idx]
@@ -95,11 +95,9 @@ class MeasurementParameter(SettingsClass, MultiParameter):
     def __repr__(self):
         return f'{self.name} measurement parameter'
 
-    def __getattribute__(self, item):
-        try:
-            return super().__getattribute__(item)
-        except AttributeError:
-            return attribute_from_config(item, config.properties)
+    def __getattr__(self, item):
+        # Only called if regular attribute lookup raises an AttributeError
+        return attribute_from_config(item, config.properties)
 
     @property
     def loc_provider(self):
@@ -794,6 +794,31 @@ class PulseSequence(ParameterNode):
         else:
             raise RuntimeError(f'Found more than one pulse satisfiying {conditions}')
 
+    def get_bounds(self, **conditions) -> Tuple[float, float]:
+        """Get start and stop time of pulses satisfying conditions.
+
+        Pulses are only iterated over once to determine both bounds.
+
+        Args:
+            **conditions: Connection and pulse conditions.
+
+        Returns:
+            (minimum `Pulse`.t_start, maximum `Pulse`.t_stop) of pulses
+            satisfying conditions, or (None, None) if there are no such pulses.
+
+        See Also:
+            `PulseSequence.get_pulses`
+        """
+        t_start = t_stop = None
+        for pulse in self.get_pulses(**conditions):
+            pulse_t_start = pulse.t_start
+            pulse_t_stop = pulse.t_stop
+            if t_start is None or pulse_t_start < t_start:
+                t_start = pulse_t_start
+            if t_stop is None or pulse_t_stop > t_stop:
+                t_stop = pulse_t_stop
+        return t_start, t_stop
+
     def get_connection(self, **conditions):
         """Get unique connections from any pulse satisfying conditions.
 
@@ -640,9 +640,18 @@ class SinePulse(Pulse):
 
         return super()._get_repr(properties_str)
 
-    def get_voltage(self, t: Union[float, Sequence]) -> Union[float, np.ndarray]:
+    def get_voltage(self,
+                    t: Union[float, Sequence],
+                    frequency: float = None) -> Union[float, np.ndarray]:
         """Get voltage(s) at time(s) t.
 
+        Args:
+            t: Time(s) at which to get the voltage(s)
+            frequency: Optional frequency to use instead of
+                `SinePulse`.frequency. Used by interfaces that approximate a
+                sine pulse by a slightly modified frequency, without having to
+                modify the pulse itself.
+
         Raises:
             AssertionError: not all ``t`` between `Pulse`.t_start and
                 `Pulse`.t_stop
@@ -651,6 +660,9 @@ class SinePulse(Pulse):
             f"voltage at {t} s is not in the time range " \
             f"{self.t_start} s - {self.t_stop} s of pulse {self}"
 
+        if frequency is None:
+            frequency = self.frequency
+
         if self.phase_reference == 'relative':
             t = t - self.t_start
 
@@ -662,7 +674,15 @@ class SinePulse(Pulse):
                 # A factor of 2 comes from the conversion from amplitude to RMS.
                 amplitude = np.sqrt(10**(self.power/10) * 1e-3 * 100)
 
-        waveform = amplitude * np.sin(2 * np.pi * (self.frequency * t + self.phase / 360))
+        # Evaluated in place to avoid allocating temporary arrays for long waveforms
+        waveform = np.multiply(frequency, t, dtype=float)
+        waveform += self.phase / 360
+        waveform *= 2 * np.pi
+        if isinstance(waveform, np.ndarray):
+            np.sin(waveform, out=waveform)
+        else:
+            waveform = np.sin(waveform)
+        waveform *= amplitude
         waveform += self.offset
 
         return waveform
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from silq.analysis.analysis import edge_voltage, find_up_proportion
+
+
+class TestEdgeVoltage(unittest.TestCase):
+    def test_empty_traces(self):
+        for traces in [[], np.zeros((0, 10))]:
+            success = edge_voltage(traces, edge='begin', state='low',
+                                   threshold_voltage=0.5)
+            self.assertEqual(len(success), 0)
+
+    def test_traces(self):
+        traces = np.array([[0] * 10, [1] * 10])
+        success = edge_voltage(traces, edge='end', state='high',
+                               threshold_voltage=0.5)
+        np.testing.assert_array_equal(success, [False, True])
+
+        # Traces with different lengths
+        traces = [np.zeros(10), np.ones(20)]
+        success = edge_voltage(traces, edge='end', state='high',
+                               threshold_voltage=0.5)
+        np.testing.assert_array_equal(success, [False, True])
+
+
+class TestFindUpProportion(unittest.TestCase):
+    def test_empty_traces(self):
+        up_proportion = find_up_proportion([], threshold_voltage=0.5)
+        self.assertEqual(up_proportion, 0)
+
+        traces_up = find_up_proportion([], threshold_voltage=0.5,
+                                       return_array=True)
+        self.assertEqual(len(traces_up), 0)
+
+    def test_traces(self):
+        traces = np.zeros((4, 10))
+        traces[1, 5] = 1
+        up_proportion = find_up_proportion(traces, threshold_voltage=0.5)
+        self.assertEqual(up_proportion, 0.25)
+
+        # Single trace
+        traces_up = find_up_proportion(traces[1], threshold_voltage=0.5,
+                                       return_array=True)
+        np.testing.assert_array_equal(traces_up, [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
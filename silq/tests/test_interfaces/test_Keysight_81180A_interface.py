@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+
+from silq.instrument_interfaces.keysight.Keysight_81180A_interface import (
+    Keysight81180AInterface,
+)
+
+from qcodes import Instrument
+from qcodes.instrument.parameter import ManualParameter
+
+
+class MockChannel:
+    def __init__(self, name):
+        self.name = name
+        self.output_coupling = ManualParameter("output_coupling",
+                                               initial_value="DC")
+        self.sample_rate = ManualParameter("sample_rate", initial_value=4.2e9)
+
+    def clear_waveforms(self):
+        pass
+
+
+class MockKeysight81180A(Instrument):
+    waveform_max_length = 1000
+
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.ch1 = MockChannel("ch1")
+        self.ch2 = MockChannel("ch2")
+        self.channels = [self.ch1, self.ch2]
+
+
+@pytest.fixture
+def interface():
+    Instrument.close_all()
+    MockKeysight81180A("keysight")
+    return Keysight81180AInterface("keysight")
+
+
+def test_waveform_memory_limit_per_channel(interface):
+    interface.waveforms = {
+        "ch1": [np.zeros(320, dtype=np.float32)],
+        "ch2": [np.zeros(640, dtype=np.float32), np.zeros(640, dtype=np.float32)],
+    }
+
+    interface._check_waveform_memory("ch1")
+    with pytest.raises(RuntimeError, match="ch2 exceeds limit"):
+        interface._check_waveform_memory("ch2")
+
+
+def test_add_waveform_within_tolerance(interface):
+    # Waveforms straddle a 1 mV rounding boundary within the same bucket
+    waveform_idx = interface.add_single_waveform("ch1", np.full(320, 0.4999e-3))
+    assert interface.add_single_waveform("ch1", np.full(320, 0.5001e-3)) == waveform_idx
+    assert len(interface.waveforms["ch1"]) == 1
+
+    # Waveforms are in neighbouring 10 mV buckets
+    waveform_idx = interface.add_single_waveform("ch1", np.full(320, 9.9995e-3))
+    assert interface.add_single_waveform("ch1", np.full(320, 10.0005e-3)) == waveform_idx
+    assert len(interface.waveforms["ch1"]) == 2
+
+    # Waveforms with different number of points are not reused
+    assert interface.add_single_waveform("ch1", np.full(640, 10e-3)) != waveform_idx
+    assert len(interface.waveforms["ch1"]) == 3
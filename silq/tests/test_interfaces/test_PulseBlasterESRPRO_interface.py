@@ -0,0 +1,155 @@
+import pytest
+import numpy as np
+
+from silq.meta_instruments.layout import Layout
+from silq.meta_instruments.chip import Chip
+
+from silq.instrument_interfaces.spincore.PulseBlasterESRPRO_interface import \
+    PulseBlasterESRPROInterface
+from silq.instrument_interfaces.chip_interface import ChipInterface
+from silq.pulses.pulse_sequences import PulseSequence
+from silq.pulses.pulse_types import TriggerPulse, MarkerPulse, TriggerWaitPulse
+
+from qcodes import Instrument
+from qcodes.instrument.parameter import ManualParameter
+
+
+class MockPulseBlasterESRPRO(Instrument):
+    def __init__(self, name, **kwargs):
+        super().__init__(name, **kwargs)
+        self.add_parameter('core_clock',
+                           parameter_class=ManualParameter,
+                           initial_value=500)
+        self.instructions = []
+
+    def stop(self):
+        pass
+
+    def start(self):
+        pass
+
+    def setup(self, initialize=True):
+        pass
+
+    def start_programming(self):
+        pass
+
+    def stop_programming(self):
+        pass
+
+    def send_instructions(self, *instructions):
+        self.instructions = list(instructions)
+
+
+def legacy_instructions(interface, output_connections, repeat=True):
+    """Instructions as created by the original per-event implementation"""
+    sample_rate = 2 * interface.instrument.core_clock.get_latest() * 1e6
+
+    instructions = []
+    inactive_channel_mask = sum(2**connection.output['channel'].id
+                                if connection.input['channel'].invert else 0
+                                for connection in output_connections)
+    if inactive_channel_mask != 0:
+        instructions.append((inactive_channel_mask, 'continue', 0, 100))
+        instructions.append((inactive_channel_mask, 'wait', 0, 100))
+
+    t = 0
+    t_stop_max = max(interface.pulse_sequence.t_stop_list)
+
+    while t < t_stop_max:
+        channel_mask = sum(pulse.implementation.implement(t=t)
+                           for pulse in interface.pulse_sequence)
+
+        active_input_pulses = interface.input_pulse_sequence.get_pulses(t_start=t)
+        if [p for p in active_input_pulses
+                if isinstance(p, TriggerWaitPulse)]:
+            instructions.append((inactive_channel_mask, 'wait', 0, 50))
+
+        t_next = min(t_val for t_val in interface.pulse_sequence.t_list
+                     if t_val > t)
+
+        wait_cycles = round((t_next - t) * sample_rate)
+        if wait_cycles < 1e9:
+            instructions.append((channel_mask, 'continue', 0, wait_cycles))
+        else:
+            instructions.append((channel_mask, 'continue', 0, 100))
+            duration = round(wait_cycles - 100)
+            divisor = int(np.ceil(duration / 1e9))
+            delay = int(duration / divisor)
+            instructions.append((channel_mask, 'long_delay', divisor, delay))
+
+        t = t_next
+
+    pulse_sequence = interface.pulse_sequence
+    wait_duration = pulse_sequence.duration + pulse_sequence.final_delay - t
+    if wait_duration > 0:
+        wait_cycles = round(wait_duration * sample_rate)
+        if wait_cycles < 1e9:
+            instructions.append((inactive_channel_mask, 'continue', 0, wait_cycles))
+        else:
+            instructions.append((inactive_channel_mask, 'continue', 0, 100))
+            duration = round(wait_cycles - 100)
+            divisor = int(np.ceil(duration / 1e9))
+            delay = int(duration / divisor)
+            instructions.append((inactive_channel_mask, 'long_delay', divisor, delay))
+
+    if repeat:
+        if inactive_channel_mask == 0:
+            instructions.append((inactive_channel_mask, 'branch', 0, 50))
+        else:
+            instructions.append((inactive_channel_mask, 'branch', 2, 50))
+    else:
+        instructions.append((inactive_channel_mask, 'stop', 0, 50))
+    return instructions
+
+
+@pytest.fixture
+def setup():
+    Instrument.close_all()
+    MockPulseBlasterESRPRO('pulseblaster')
+    pulseblaster_interface = PulseBlasterESRPROInterface('pulseblaster')
+
+    Chip('chip', channels=['ch1', 'ch2'])
+    chip_interface = ChipInterface('chip')
+    # Inverted input channel, which is high when its pulse is not active
+    chip_interface.get_channel('ch2').invert = True
+
+    layout = Layout(instrument_interfaces=[pulseblaster_interface,
+                                           chip_interface])
+    layout.load_connections(connections_dicts=[
+        {"output_arg": "pulseblaster.ch1",
+         "input_arg": "chip.ch1"},
+        {"output_arg": "pulseblaster.ch2",
+         "input_arg": "chip.ch2"},
+    ])
+    layout.primary_instrument('pulseblaster')
+    return {'pulseblaster_interface': pulseblaster_interface,
+            'layout': layout}
+
+
+def test_instructions_equal_legacy(setup):
+    layout = setup['layout']
+    pulseblaster_interface = setup['pulseblaster_interface']
+
+    pulse_sequence = PulseSequence(pulses=[
+        TriggerPulse(t_start=1e-3, duration=1e-6,
+                     connection_requirements={'output_arg': 'pulseblaster.ch1'}),
+        MarkerPulse(t_start=2e-3, t_stop=5e-3,
+                    connection_requirements={'output_arg': 'pulseblaster.ch2'}),
+        TriggerPulse(t_start=4e-3, duration=1e-6,
+                     connection_requirements={'output_arg': 'pulseblaster.ch1'}),
+        # Long pulse, requiring a long_delay instruction
+        MarkerPulse(t_start=6e-3, t_stop=10,
+                    connection_requirements={'output_arg': 'pulseblaster.ch1'}),
+    ])
+    layout.pulse_sequence = pulse_sequence
+
+    output_connections = layout.get_connections(
+        output_interface=pulseblaster_interface)
+    pulseblaster_interface.setup(output_connections=output_connections)
+
+    instructions = pulseblaster_interface.instrument.instructions
+    assert instructions == legacy_instructions(pulseblaster_interface,
+                                               output_connections)
+    # Inverted ch2 is high when inactive
+    assert instructions[0] == (2, 'continue', 0, 100)
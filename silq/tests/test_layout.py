@@ -0,0 +1,124 @@
+import pytest
+import h5py
+import numpy as np
+from types import SimpleNamespace
+
+from silq.meta_instruments.layout import Layout, SingleConnection
+from silq.meta_instruments.chip import Chip
+from silq.pulses.pulse_types import DCPulse
+
+from silq.instrument_interfaces.Tektronix.AWG520_interface import AWG520Interface
+from silq.instrument_interfaces.chip_interface import ChipInterface
+
+import qcodes as qc
+from qcodes import Instrument
+
+
+@pytest.fixture
+def setup():
+    Instrument.close_all()
+    Instrument('AWG520')
+    AWG_interface = AWG520Interface('AWG520')
+
+    Chip('chip', channels=['ch1', 'ch2'])
+    chip_interface = ChipInterface('chip')
+
+    layout = Layout(instrument_interfaces=[AWG_interface, chip_interface])
+    layout.load_connections(connections_dicts=[
+        {"output_arg": "AWG520.ch1",
+         "input_arg": "chip.ch1"},
+        {"output_arg": "AWG520.ch2",
+         "input_arg": "chip.ch2"},
+    ])
+    return {'AWG_interface': AWG_interface,
+            'chip_interface': chip_interface,
+            'layout': layout}
+
+
+def replace_connection(setup, idx, output_channel, input_channel):
+    """Replace a connection directly, keeping the number of connections"""
+    setup['layout'].connections[idx] = SingleConnection(
+        output_instrument='AWG520',
+        output_channel=setup['AWG_interface'].get_channel(output_channel),
+        input_instrument='chip',
+        input_channel=setup['chip_interface'].get_channel(input_channel))
+    return setup['layout'].connections[idx]
+
+
+def test_replace_connection(setup):
+    layout = setup['layout']
+
+    connections = layout.get_connections(output_instrument='AWG520',
+                                         input_channel='ch2')
+    assert len(connections) == 1
+    assert connections[0].output['channel'].name == 'ch2'
+
+    connection = replace_connection(setup, 1, output_channel='ch1',
+                                    input_channel='ch2')
+    connections = layout.get_connections(output_instrument='AWG520',
+                                         input_channel='ch2')
+    assert connections == [connection]
+    assert connections[0].output['channel'].name == 'ch1'
+
+
+def test_replace_pulse_connection(setup):
+    layout = setup['layout']
+
+    DC_pulse = DCPulse(t_start=0, duration=10e-3, amplitude=1,
+                       connection_requirements={'input_channel': 'ch2'})
+    connection = layout.get_pulse_connection(DC_pulse)
+    assert connection.output['channel'].name == 'ch2'
+
+    # A pulse with the same requirements should get the replaced connection
+    connection = replace_connection(setup, 1, output_channel='ch1',
+                                    input_channel='ch2')
+    DC_pulse = DCPulse(t_start=0, duration=10e-3, amplitude=1,
+                       connection_requirements={'input_channel': 'ch2'})
+    assert layout.get_pulse_connection(DC_pulse) is connection
+
+
+def test_trace_dataset_dtype(tmp_path):
+    with h5py.File(str(tmp_path / 'traces.hdf5'), 'w') as file:
+        Layout._create_trace_datasets(file, channels=['output'],
+                                      shape=(2, 3, 10), precision=3)
+        # Traces rounded to a limited precision are stored in single precision
+        assert file['output'].dtype == np.float32
+        file['output'][0] = np.full((3, 10), 0.12345)
+        assert np.allclose(file['output'][0], 0.123, atol=1e-3)
+
+        Layout._create_trace_datasets(file, channels=['lossless'],
+                                      shape=(2, 3, 10), precision=None)
+        assert file['lossless'].dtype == np.float64
+
+
+def test_save_traces_precision(setup, tmp_path, monkeypatch):
+    layout = setup['layout']
+    layout.acquisition_channels([('chA', 'output')])
+
+    traces = np.full((3, 10), 0.12345)
+    monkeypatch.setattr(qc, 'active_measurement',
+                        lambda: SimpleNamespace(loop_indices=(0,)))
+    monkeypatch.setattr(Layout, 'acquisition_interface',
+                        SimpleNamespace(traces={'chA': traces}))
+
+    initialize_kwargs = {}
+    def initialize_trace_file(name, folder=None, channels=None,
+                              precision=3, compression=4):
+        initialize_kwargs.update(precision=precision, compression=compression)
+        file = h5py.File(str(tmp_path / f'{name}.hdf5'), 'w')
+        Layout._create_trace_datasets(file.create_group('traces'),
+                                      channels=['output'], shape=(1, 3, 10),
+                                      precision=precision,
+                                      compression=compression)
+        return file
+    monkeypatch.setattr(layout, 'initialize_trace_file', initialize_trace_file)
+
+    try:
+        trace_file = layout.save_traces(name='traces', precision=None,
+                                        compression=2)
+        assert initialize_kwargs == {'precision': None, 'compression': 2}
+        # Traces are saved without rounding
+        assert trace_file['traces/output'].dtype == np.float64
+        np.testing.assert_array_equal(trace_file['traces/output'][0], traces)
+    finally:
+        layout.close_trace_files()
@@ -116,6 +116,20 @@ class TestPulseSequence(unittest.TestCase):
         self.assertIs(pulse_sequence.get_pulse(name='p1[0]'), p1_added)
         self.assertIs(pulse_sequence.get_pulse(name='p1[1]'), p2_added)
 
+    def test_get_bounds(self):
+        pulse_sequence = PulseSequence()
+        self.assertEqual(pulse_sequence.get_bounds(), (None, None))
+
+        pulse_sequence.add(DCPulse(name='dc1', t_start=1, duration=10),
+                           DCPulse(name='dc2', t_start=0, duration=5),
+                           DCPulse(name='dc3', t_start=3, duration=2,
+                                   acquire=True))
+        self.assertEqual(pulse_sequence.get_bounds(), (0, 11))
+        self.assertEqual(pulse_sequence.get_bounds(acquire=True), (3, 5))
+
+        pulse_sequence['dc1'].t_start = 2
+        self.assertEqual(pulse_sequence.get_bounds(), (0, 12))
+
     def test_get_pulses_connection_label(self):
         pulse_sequence = PulseSequence()
         pulse1, pulse2 = pulse_sequence.add(
@@ -5,7 +5,7 @@ import pickle
 
 from silq.meta_instruments.layout import SingleConnection
 from silq.instrument_interfaces.interface import Channel
-from silq.pulses import DCPulse, Pulse
+from silq.pulses import DCPulse, SinePulse, Pulse
 from silq.tools.config import *
 import silq
 
@@ -69,6 +69,13 @@ class TestPulse(unittest.TestCase):
         self.assertEqual(p['t_stop'].get_latest(), 3)
         self.assertEqual(p.t_stop, 3)
 
+    def test_sine_pulse_voltage_frequency(self):
+        p = SinePulse(t_start=0, duration=1, frequency=1, amplitude=1)
+        self.assertAlmostEqual(p.get_voltage(0.25), 1)
+        self.assertAlmostEqual(p.get_voltage(0.25, frequency=2), 0)
+        # Pulse frequency is not modified
+        self.assertEqual(p.frequency, 1)
+
     def test_pulse_no_id(self):
         p = Pulse('name')
         p.id = None
@@ -233,12 +233,11 @@ def attribute_from_config(item: str, config: dict):
         AttributeError: item not found.
 
     """
-    # check if {item}_{self.mode} is in properties_config
-    # if mode is None, mode_str='', in which case it checks for {item}
-    if item in config:
-        # Check if item is in properties config
+    # Retrieve item directly, since checking if item is in config first
+    # resolves any config inheritance twice
+    try:
         value = config[item]
-    else:
+    except KeyError:
         raise AttributeError
 
     if type(value) is DotDict:
@@ -702,36 +701,41 @@ def find_approximate_divisor(
         If successful, a dict containing {'points', 'cycles', 'remaining_points'}
         If unsuccessful, None
     """
+    N = int(N)
+
     # Minimum points can't be less than N/max_cycles
-    min_points = max(int(np.ceil(N / max_cycles)), min_points)
+    min_points = max(-(-N // max_cycles), min_points)
     # Minimum points must be a multiple of points_multiple
     min_points += (points_multiple - min_points) % points_multiple
 
-    for points in range(min_points, max_points, points_multiple):
+    # Candidate points are evaluated in blocks, such that the first suitable
+    # divisor is still found without evaluating all candidates
+    block_size = 1024 * points_multiple
+    for block_start in range(min_points, max_points, block_size):
+        block_stop = min(block_start + block_size, max_points)
+        points = np.arange(block_start, block_stop, points_multiple, dtype=np.int64)
         cycles = N // points
         remaining_points = N - points * cycles
 
         # Increase remaining_points if there are remaining points and they
         # are less than min_remaining_points
-        if remaining_points and remaining_points < min_remaining_points:
-            subtract_cycles = np.ceil(
-                (min_remaining_points - remaining_points) / points
-            )
-            remaining_points += subtract_cycles * points
-            if cycles - subtract_cycles < 1:
-                # Remaining points cannot be incorporated
-                continue
-
-            cycles -= subtract_cycles
-
-        if (
-            min_points <= points <= max_points
-            and remaining_points <= max_remaining_points
-        ):
+        increase = (remaining_points > 0) & (remaining_points < min_remaining_points)
+        subtract_cycles = np.where(
+            increase, -(-(min_remaining_points - remaining_points) // points), 0
+        )
+        remaining_points += subtract_cycles * points
+        cycles -= subtract_cycles
+
+        # Remaining points cannot be incorporated if no cycles are left
+        valid = ~increase | (cycles >= 1)
+        valid &= remaining_points <= max_remaining_points
+
+        if valid.any():
+            idx = int(np.argmax(valid))
             return {
-                "points": int(points),
-                "cycles": int(cycles),
-                "remaining_points": int(remaining_points),
+                "points": int(points[idx]),
+                "cycles": int(cycles[idx]),
+                "remaining_points": int(remaining_points[idx]),
             }
     else:
         return None